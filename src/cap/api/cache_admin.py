@@ -147,6 +147,7 @@ async def clear_cache():
             # Count keys before deletion
             cache_keys = []
             count_keys = []
+            results_keys = []
 
             async for key in client.scan_iter(match="nlq:cache:*"):
                 cache_keys.append(key)
@@ -154,13 +155,22 @@ async def clear_cache():
             async for key in client.scan_iter(match="nlq:count:*"):
                 count_keys.append(key)
 
+            # Formatted results are derived from the results and go with them
+            async for key in client.scan_iter(match="nlq:results:*"):
+                results_keys.append(key)
+            async for key in client.scan_iter(match="nlq:fmt:*"):
+                results_keys.append(key)
+
             # Delete all keys
             if cache_keys:
                 await client.delete(*cache_keys)
             if count_keys:
                 await client.delete(*count_keys)
+            if results_keys:
+                await client.delete(*results_keys)
+            redis_client.clear_local_cache()
 
-            total_deleted = len(cache_keys) + len(count_keys)
+            total_deleted = len(cache_keys) + len(count_keys) + len(results_keys)
 
             span.set_attribute("keys_deleted", total_deleted)
             logger.info(f"Cleared {total_deleted} cache keys")
@@ -169,6 +179,7 @@ async def clear_cache():
                 "message": "Cache cleared successfully",
                 "cache_entries_deleted": len(cache_keys),
                 "count_entries_deleted": len(count_keys),
+                "results_entries_deleted": len(results_keys),
                 "total_deleted": total_deleted
             }
 
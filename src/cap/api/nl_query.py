@@ -2,26 +2,77 @@
 Natural language query API endpoint using Ollama LLM.
 Multi-stage pipeline: NL -> SPARQL -> Execute -> Contextualize -> Stream
 """
+import ast
+import functools
 import logging
-import json
+import math
+import operator
 import re
-from typing import Optional
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from opentelemetry import trace
-from typing import Optional, Any
+from typing import Optional, Any, Awaitable, Callable
+import orjson
 
-from cap.data.sparql_util import convert_sparql_to_kv, format_for_llm
+from cap.config import settings
+from cap.data.sparql_util import convert_sparql_to_kv, format_for_llm, format_simple_answer
 from cap.services.ollama_client import get_ollama_client
-from cap.services.redis_client import get_redis_client
-from cap.data.virtuoso import VirtuosoClient
+from cap.services.redis_client import RedisClient, get_redis_client
+from cap.data.virtuoso import VirtuosoClient, get_virtuoso_client
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 router = APIRouter(prefix="/api/v1/nl", tags=["llm"])
 
+# Patterns used on every sequential query execution
+_QUERY_SPLIT_RE = re.compile(r'---query \d+[^-]*---')
+_INJECT_RE = re.compile(r'INJECT\([^)]+\)')
+_INJECT_NESTED_RE = re.compile(r'INJECT(?:_FROM_PREVIOUS)?\((?:[^()]+|\([^()]*\))+\)')
+_EVALUATE_RE = re.compile(r'evaluate\(([^)]+)\)')
+_INJECT_STRIP_RE = re.compile(r'^INJECT(?:_FROM_PREVIOUS)?\((.+)\)$')
+_EVALUATE_STRIP_RE = re.compile(r'^evaluate\((.+)\)$')
+_SPARQL_VAR_RE = re.compile(r'[?$](\w+)')
+
+# Functions and operators available to INJECT expressions
+_SAFE_FUNCTIONS = {
+    "int": int,
+    "float": float,
+    "round": round,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "ceil": math.ceil,
+    "floor": math.floor,
+}
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+# Largest exponent accepted by ** so an INJECT expression cannot stall the event loop
+_MAX_EXPONENT = 64
+_MAX_POWER_BITS = 1024
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a JSON string with orjson."""
+    return orjson.dumps(value).decode()
+
+class _ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 class NLQueryRequest(BaseModel):
     """Natural language query request."""
@@ -84,45 +135,61 @@ class StatusMessage:
         return f"Error: {message}\n"
 
 
+_STREAM_END = object()
+
+# Line terminator appended to every streamed answer chunk
+_NL = b"\n"
+
+async def _drain_stream(stream_generator, queue: asyncio.Queue):
+    """Push every chunk of the stream into the queue, then an end marker (or the error raised)."""
+    try:
+        async for chunk in stream_generator:
+            await queue.put(chunk)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(_STREAM_END)
+
 async def _stream_with_timeout_messages(
     stream_generator,
-    timeout_seconds: float = 300.0
+    timeout_seconds: float = 300.0,
+    max_buffered: int = 256
 ):
     """
     Wrap a stream generator with timeout status messages.
+
+    A background task drains the generator into a bounded queue, so a timeout never
+    cancels the generator itself. Buffered chunks are forwarded without waiting; when the
+    queue is empty, the wait is bounded with asyncio.timeout, which unlike wait_for does
+    not wrap the get in a new task for every chunk.
     """
     message_cycle = StatusMessage.get_thinking_message_cycle()
-    last_status_time = asyncio.get_event_loop().time()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered)
+    producer = asyncio.create_task(_drain_stream(stream_generator, queue))
 
     try:
-        # Convert generator to async iterator once
-        stream_iter = stream_generator.__aiter__()
-
         while True:
             try:
-                # Wait for next chunk with timeout
-                chunk = await asyncio.wait_for(
-                    stream_iter.__anext__(),
-                    timeout=timeout_seconds
-                )
-                # Got a chunk, yield it and reset timer
-                last_status_time = asyncio.get_event_loop().time()
-                yield chunk
-
-            except asyncio.TimeoutError:
-                # No output for timeout_seconds, emit a thinking message
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_status_time >= timeout_seconds:
+                chunk = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    async with asyncio.timeout(timeout_seconds):
+                        chunk = await queue.get()
+                except TimeoutError:
+                    # No output for timeout_seconds, emit a thinking message
                     yield next(message_cycle)
-                    last_status_time = current_time
-                # Continue waiting for next chunk
-                continue
+                    continue
 
-            except StopAsyncIteration:
+            if chunk is _STREAM_END:
                 # Stream ended normally
                 logger.info("LLM stream completed successfully")
                 break
 
+            if isinstance(chunk, Exception):
+                raise chunk
+
+            yield chunk
+
     except asyncio.CancelledError:
         # Client disconnected - log it but don't raise
         logger.warning("Client cancelled the stream connection")
@@ -137,12 +204,15 @@ async def _stream_with_timeout_messages(
         except:
             pass
 
+    finally:
+        producer.cancel()
+
 def _parse_cached_sequential_sparql(sparql_text: str) -> list[dict[str, Any]]:
     """Parse sequential SPARQL from cache that uses old separator format."""
     queries = []
 
     # Split by query markers (support both old and new formats)
-    parts = re.split(r'---query \d+[^-]*---', sparql_text)
+    parts = _QUERY_SPLIT_RE.split(sparql_text)
 
     for part in parts[1:]:  # Skip first empty part
         part = part.strip()
@@ -150,8 +220,7 @@ def _parse_cached_sequential_sparql(sparql_text: str) -> list[dict[str, Any]]:
             continue
 
         # Extract injection parameters
-        inject_pattern = r'INJECT\([^)]+\)'
-        inject_matches = re.findall(inject_pattern, part)
+        inject_matches = _INJECT_RE.findall(part)
 
         queries.append({
             'query': part,
@@ -160,137 +229,226 @@ def _parse_cached_sequential_sparql(sparql_text: str) -> list[dict[str, Any]]:
 
     return queries
 
+def _as_int_for_limit(value: Any) -> Any:
+    """Round numeric injection values to a positive integer usable in LIMIT/OFFSET."""
+    if not isinstance(value, (int, float)):
+        return value
+    injected_int = int(round(value))
+    # Ensure at least 1 for LIMIT clauses
+    if injected_int < 1:
+        logger.warning(f"LIMIT value {injected_int} < 1, setting to 1")
+        injected_int = 1
+    return injected_int
+
+def _coerce_binding_value(raw_value: Any) -> Any:
+    """
+    Convert a SPARQL binding value to a number when possible.
+
+    Previous results are handed to the injection evaluator as its variable
+    namespace, so values must already be numeric for arithmetic to work.
+    """
+    try:
+        numeric_value = float(raw_value)
+    except (ValueError, TypeError):
+        return raw_value
+    # Store as int if whole number
+    if numeric_value.is_integer():
+        return int(numeric_value)
+    return numeric_value
+
+def _injection_variables(query: str) -> Optional[frozenset[str]]:
+    """Collect the variables referenced by a query's INJECT sites, or None if one cannot be parsed."""
+    names: set[str] = set()
+    for expression in _INJECT_NESTED_RE.findall(query):
+        try:
+            names |= _compile_injection(expression)[1]
+        except SyntaxError:
+            return None
+    return frozenset(names)
+
+def _plan_query_levels(queries: list[dict[str, Any]]) -> list[list[int]]:
+    """
+    Group sequential queries into levels that can run concurrently.
+
+    A query depends on every earlier query that mentions a variable it injects (a superset
+    of the queries that can bind it). When the source of a variable is unknown, the query
+    waits for every earlier query, which is the fully serial behavior.
+    """
+    mentioned = [frozenset(_SPARQL_VAR_RE.findall(query_info['query'])) for query_info in queries]
+    query_levels: list[int] = []
+
+    for idx, query_info in enumerate(queries):
+        needed = _injection_variables(query_info['query'])
+        if needed is None:
+            deps = set(range(idx))
+        else:
+            deps = set()
+            for var in needed:
+                producers = [j for j in range(idx) if var in mentioned[j]]
+                if producers:
+                    deps.update(producers)
+                else:
+                    deps.update(range(idx))
+        query_levels.append(max((query_levels[j] + 1 for j in deps), default=0))
+
+    levels: list[list[int]] = [[] for _ in range(max(query_levels, default=-1) + 1)]
+    for idx, level in enumerate(query_levels):
+        levels[level].append(idx)
+    return levels
+
+def _extract_result_variables(results: dict[str, Any]) -> dict[str, Any]:
+    """Extract the variables of the first result row (or the ASK answer) for later injection."""
+    bindings = results.get('results', {}).get('bindings')
+    if bindings:
+        # Extract ALL variables from first binding
+        return {var: _coerce_binding_value(value_obj.get('value')) for var, value_obj in bindings[0].items()}
+    if results.get('boolean') is not None:
+        return {'boolean': results['boolean']}
+    return {}
+
 async def _execute_sequential_queries(
     virtuoso: VirtuosoClient,
     queries: list[dict[str, Any]]
 ) -> dict[str, Any]:
-    """Execute sequential SPARQL queries with result injection."""
-    previous_results = {}
-    final_results = None
-
-    for idx, query_info in enumerate(queries):
-        query = query_info['query']
-        inject_params = query_info.get('inject_params', [])
+    """
+    Execute sequential SPARQL queries with result injection.
 
-        logger.info(f"Executing query {idx + 1}/{len(queries)}")
+    Queries that do not depend on each other's results run concurrently; each query still
+    sees the variables of the queries before it, as if they had run one after another.
+    virtuoso must therefore keep no per-query state between concurrent execute_query calls.
+    """
+    results_by_query: list[Optional[dict[str, Any]]] = [None] * len(queries)
+    variables_by_query: list[dict[str, Any]] = [{} for _ in queries]
 
-        # Inject previous results BEFORE execution
-        for param_expr in inject_params:
-            injected_value = _evaluate_injection(param_expr, previous_results)
+    for level in _plan_query_levels(queries):
+        level_queries = []
+        for idx in level:
+            query = queries[idx]['query']
+            logger.info(f"Executing query {idx + 1}/{len(queries)}")
 
-            # Match INJECT with nested parentheses
-            inject_pattern = r'INJECT(?:_FROM_PREVIOUS)?\((?:[^()]+|\([^()]*\))+\)'
+            previous_results: dict[str, Any] = {}
+            for variables in variables_by_query[:idx]:
+                previous_results.update(variables)
 
-            match = re.search(inject_pattern, query)
-            if match:
+            # Inject previous results BEFORE execution, in a single pass over the query
+            def _inject_sub(match: re.Match, previous_results: dict[str, Any] = previous_results) -> str:
                 original = match.group(0)
-                # **FIX: Ensure integer for LIMIT/OFFSET, convert floats properly**
-                if isinstance(injected_value, (int, float)):
-                    # Round and convert to int for LIMIT/OFFSET clauses
-                    injected_int = int(round(injected_value))
-                    # Ensure at least 1 for LIMIT clauses
-                    if injected_int < 1:
-                        logger.warning(f"LIMIT value {injected_int} < 1, setting to 1")
-                        injected_int = 1
-                    replacement = str(injected_int)
-                else:
-                    replacement = str(injected_value)
-
+                replacement = str(_as_int_for_limit(_evaluate_injection(original, previous_results)))
                 logger.info(f"Replacing '{original}' with '{replacement}'")
-                query = query.replace(original, replacement, 1)
-            else:
-                logger.warning(f"Could not find INJECT pattern for: {param_expr}")
-
-        # Execute the clean SPARQL query string directly
-        logger.info(f"Executing query {idx + 1}: {query[:200]}...")
-
-        # Execute as plain SPARQL string
-        results = await virtuoso.execute_query(query)
+                return replacement
 
-        if results.get('results', {}).get('bindings'):
-            bindings = results['results']['bindings']
-            logger.info(f"Query {idx + 1} returned {len(bindings)} rows")
+            query = _INJECT_NESTED_RE.sub(_inject_sub, query)
+            logger.info(f"Executing query {idx + 1}: {query[:200]}...")
+            level_queries.append(query)
 
-            if bindings:
-                # Extract ALL variables from first binding
-                first_row = bindings[0]
-                for var, value_obj in first_row.items():
-                    raw_value = value_obj.get('value')
+        # Execute the clean SPARQL query strings of this level concurrently
+        level_results = await asyncio.gather(*(virtuoso.execute_query(query) for query in level_queries))
 
-                    # Try numeric conversion
-                    try:
-                        numeric_value = float(raw_value)
-                        # Store as int if whole number
-                        if numeric_value.is_integer():
-                            previous_results[var] = int(numeric_value)
-                        else:
-                            previous_results[var] = numeric_value
-                        logger.info(f"Stored {var}={previous_results[var]} (numeric)")
-                    except (ValueError, TypeError):
-                        previous_results[var] = raw_value
-                        logger.info(f"Stored {var}={raw_value} (string)")
-
-        elif results.get('boolean') is not None:
-            previous_results['boolean'] = results['boolean']
-            logger.info(f"Stored boolean={results['boolean']}")
-        else:
-            logger.warning(f"Query {idx + 1} returned no results")
-
-        final_results = results
+        for idx, results in zip(level, level_results, strict=True):
+            results_by_query[idx] = results
+            variables_by_query[idx] = _extract_result_variables(results)
+            if variables_by_query[idx]:
+                logger.info(f"Query {idx + 1} stored {variables_by_query[idx]!r}")
+            else:
+                logger.warning(f"Query {idx + 1} returned no results")
 
+    final_results = results_by_query[-1] if results_by_query else None
     return final_results if final_results else {}
 
-def _evaluate_injection(expression: str, previous_results: dict) -> Any:
-    """Evaluate injection expression with previous results."""
+class _InjectionEvaluator(ast.NodeVisitor):
+    """Evaluates a whitelisted arithmetic expression tree against previous query results."""
+
+    def __init__(self, variables: dict[str, Any]):
+        self.variables = variables
+
+    def visit_BinOp(self, node: ast.BinOp) -> Any:
+        op = _BIN_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        left, right = self.visit(node.left), self.visit(node.right)
+        if op is operator.pow:
+            if abs(right) > _MAX_EXPONENT:
+                raise ValueError(f"Exponent too large: {right!r}")
+            # Nested powers grow the result exponentially, so bound its size, not just the exponent
+            if isinstance(left, int) and isinstance(right, int) and left.bit_length() * right > _MAX_POWER_BITS:
+                raise ValueError(f"Power too large: {left!r} ** {right!r}")
+        if op is operator.mul and (isinstance(left, str) or isinstance(right, str)):
+            raise ValueError("Unsupported string repetition")
+        return op(left, right)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> Any:
+        op = _UNARY_OPS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        return op(self.visit(node.operand))
+
+    def visit_Constant(self, node: ast.Constant) -> Any:
+        if isinstance(node.value, (int, float, str)):
+            return node.value
+        raise ValueError(f"Unsupported constant: {node.value!r}")
+
+    def visit_Name(self, node: ast.Name) -> Any:
+        if node.id not in self.variables:
+            raise NameError(f"name '{node.id}' is not defined")
+        return self.variables[node.id]
+
+    def visit_Call(self, node: ast.Call) -> Any:
+        if not isinstance(node.func, ast.Name) or node.func.id not in _SAFE_FUNCTIONS or node.keywords:
+            raise ValueError(f"Unsupported function call: {ast.unparse(node.func)}")
+        return _SAFE_FUNCTIONS[node.func.id](*(self.visit(arg) for arg in node.args))
+
+    def generic_visit(self, node: ast.AST) -> Any:
+        raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+@functools.lru_cache(maxsize=512)
+def _compile_injection(expression: str) -> tuple[ast.expr, frozenset[str]]:
+    """
+    Strip the INJECT/evaluate wrappers from an injection expression and parse it once.
+
+    Returns the expression tree and the variable names it references.
+    """
     # Extract the actual expression
     expr = expression
     if 'evaluate(' in expr:
-        match = re.search(r'evaluate\(([^)]+)\)', expr)
+        match = _EVALUATE_RE.search(expr)
         if match:
             expr = match.group(1)
 
     # Remove INJECT wrapper if present
-    expr = re.sub(r'^INJECT(?:_FROM_PREVIOUS)?\((.+)\)$', r'\1', expr)
-    expr = re.sub(r'^evaluate\((.+)\)$', r'\1', expr)
+    expr = _INJECT_STRIP_RE.sub(r'\1', expr)
+    expr = _EVALUATE_STRIP_RE.sub(r'\1', expr)
+
+    tree = ast.parse(expr, mode='eval').body
+    names = frozenset(
+        node.id for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and node.id not in _SAFE_FUNCTIONS
+    )
+    return tree, names
 
-    logger.info(f"Evaluating injection expression: '{expr}'")
+def _evaluate_injection(expression: str, previous_results: dict) -> Any:
+    """Evaluate injection expression with previous results."""
+    try:
+        tree, required_vars = _compile_injection(expression)
+    except SyntaxError as e:
+        logger.error(f"Injection expression could not be parsed: {e}")
+        return 1  # Safe default prevents LIMIT 0
+
+    logger.info(f"Evaluating injection expression: '{expression}'")
     logger.info(f"Available variables: {previous_results}")
 
     # **ENHANCED: Check for missing variables before evaluation**
-    required_vars = re.findall(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\b', expr)
-    missing_vars = [v for v in required_vars if v not in previous_results and v not in ['int', 'float', 'round', 'abs', 'min', 'max']]
+    missing_vars = [v for v in required_vars if v not in previous_results]
 
     if missing_vars:
         logger.error(f"Missing variables in injection: {missing_vars}")
-        logger.error(f"Expression: {expr}")
+        logger.error(f"Expression: {expression}")
         logger.error(f"Available: {list(previous_results.keys())}")
         # Return safe default instead of 0
         return 1  # Prevents LIMIT 0 issues
 
-    # Replace variable names with their values
-    for var, value in previous_results.items():
-        if var in expr:
-            if isinstance(value, (int, float)):
-                expr = expr.replace(var, str(value))
-                logger.info(f"Replaced {var} with {value}")
-            else:
-                expr = expr.replace(var, f"'{value}'")
-
-    # Safely evaluate with math operations allowed
+    # Walk the whitelisted expression tree; variables resolve from previous_results
     try:
-        import math
-        safe_dict = {
-            "__builtins__": {},
-            "int": int,
-            "float": float,
-            "round": round,
-            "abs": abs,
-            "min": min,
-            "max": max,
-            "ceil": math.ceil,
-            "floor": math.floor,
-        }
-        result = eval(expr, safe_dict, {})
+        result = _InjectionEvaluator(previous_results).visit(tree)
         logger.info(f"Injection evaluated to: {result}")
 
         # Always return integer for LIMIT/OFFSET clauses**
@@ -307,7 +465,67 @@ def _evaluate_injection(expression: str, previous_results: dict) -> Any:
         logger.error(f"Injection evaluation error: {e}")
         return 1  # Safe default prevents LIMIT 0
 
-@router.get("/queries/top")
+def _count_results(sparql_results: dict[str, Any]) -> int:
+    """Count result rows of a SPARQL JSON response (an ASK answer counts as one)."""
+    if sparql_results.get('results', {}).get('bindings'):
+        return len(sparql_results['results']['bindings'])
+    if sparql_results.get('boolean') is not None:
+        return 1
+    return 0
+
+# In-flight backend calls keyed by request, shared by concurrent identical requests
+_inflight: dict[str, asyncio.Future] = {}
+
+async def _singleflight(key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run func once for concurrent callers that use the same key.
+
+    The first caller starts func as a task; callers arriving before it finishes await
+    that task instead of starting their own. The task is shielded so a disconnecting
+    client does not cancel the work other callers are waiting on.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func())
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Future) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+    else:
+        logger.info(f"Joining in-flight request for {key[:100]}")
+
+    return await asyncio.shield(task)
+
+async def _execute_with_results_cache(
+    redis_client: RedisClient,
+    sparql_query: str,
+    execute: Callable[[], Awaitable[dict[str, Any]]]
+) -> tuple[dict[str, Any], bool]:
+    """
+    Return results for a SPARQL query, reusing results cached under the same SPARQL.
+
+    Different natural language phrasings often produce the same SPARQL; they share one
+    cached result set instead of each going to Virtuoso. Only non-empty results are cached.
+
+    Returns the results and whether they came from the cache.
+    """
+    cached_results = await redis_client.get_cached_sparql_results(sparql_query)
+    if cached_results is not None:
+        logger.info("SPARQL results cache hit")
+        return cached_results, True
+
+    async def _execute_and_cache() -> dict[str, Any]:
+        sparql_results = await execute()
+        if sparql_results and _count_results(sparql_results) > 0:
+            await redis_client.cache_sparql_results(sparql_query, sparql_results)
+        return sparql_results
+
+    return await _singleflight(f"sparql:{redis_client._sparql_digest(sparql_query)}", _execute_and_cache), False
+
+@router.get("/queries/top", response_class=_ORJSONResponse)
 async def get_top_queries(limit: int = 5):
     """
     Get top N most frequently asked queries.
@@ -360,11 +578,11 @@ async def natural_language_query(request: NLQueryRequest):
         async def response_stream():
             try:
                 # Status: Processing query
-                yield f"{StatusMessage.processing_query()}"
+                yield StatusMessage.processing_query()
 
                 # Get clients
                 ollama = get_ollama_client()
-                virtuoso = VirtuosoClient()
+                virtuoso = get_virtuoso_client()
                 redis_client = get_redis_client()
 
                 # Build the user query
@@ -378,6 +596,7 @@ async def natural_language_query(request: NLQueryRequest):
 
                 sparql_query = ""
                 sparql_results = None
+                results_from_cache = False
 
                 # Stage 1: Convert NL to SPARQL
                 logger.info(f"Stage 1: convert NL to sparql")
@@ -387,7 +606,7 @@ async def natural_language_query(request: NLQueryRequest):
 
                     # Try to parse as JSON first (new format)
                     try:
-                        parsed = json.loads(cached_sparql)
+                        parsed = orjson.loads(cached_sparql)
                         if isinstance(parsed, list) and len(parsed) > 0:
                             is_sequential = True
                             sparql_queries = parsed
@@ -396,7 +615,7 @@ async def natural_language_query(request: NLQueryRequest):
                             is_sequential = False
                             sparql_query = cached_sparql
                             logger.info(f"cached_data has single sparql")
-                    except (json.JSONDecodeError, TypeError):
+                    except (orjson.JSONDecodeError, TypeError):
                         # Fallback to old format with separator
                         if "---split" in cached_sparql or "---query" in cached_sparql:
                             is_sequential = True
@@ -408,16 +627,20 @@ async def natural_language_query(request: NLQueryRequest):
                             sparql_query = cached_sparql
 
                 else:
-                    yield f"{StatusMessage.generating_sparql()}"
+                    yield StatusMessage.generating_sparql()
 
                     try:
                         logger.info(f"Cache miss. Creating sparql using llm...")
                         # Generate raw response
-                        raw_sparql_response = await ollama.generate_complete(
-                            prompt=user_query,
-                            model=ollama.llm_model,
-                            system_prompt=ollama.nl_to_sparql_prompt,
-                            temperature=0.0
+                        # Coalesce concurrent requests that the query cache would treat as equal
+                        raw_sparql_response = await _singleflight(
+                            f"nl:{redis_client._normalize_query(user_query)}",
+                            lambda: ollama.generate_complete(
+                                prompt=user_query,
+                                model=ollama.llm_model,
+                                system_prompt=ollama.nl_to_sparql_prompt,
+                                temperature=0.0
+                            )
                         )
                         logger.info(f"Generated raw SPARQL response: {raw_sparql_response[:200]}...")
 
@@ -444,58 +667,61 @@ async def natural_language_query(request: NLQueryRequest):
                 logger.info(f"Initiating stage 2 for {user_query}")
                 if is_sequential:
                     logger.info("stage2: executing sparql list")
-                    yield f"{StatusMessage.executing_query()}"
+                    yield StatusMessage.executing_query()
                     try:
-                        sparql_results = await _execute_sequential_queries(virtuoso, sparql_queries)
+                        # Serialized once, used for the caches and for contextualization
+                        sparql_query = _json_dumps(sparql_queries)
+                        sparql_results, results_from_cache = await _execute_with_results_cache(
+                            redis_client,
+                            sparql_query,
+                            lambda: _execute_sequential_queries(virtuoso, sparql_queries)
+                        )
                         if sparql_results:
                             # Check result count from final results
-                            result_count = 0
-                            if sparql_results.get('results', {}).get('bindings'):
-                                result_count = len(sparql_results['results']['bindings'])
-                            elif sparql_results.get('boolean') is not None:
-                                result_count = 1
+                            result_count = _count_results(sparql_results)
 
                             span.set_attribute("result_count", result_count)
                             logger.info(f"Sequential SPARQL returned {result_count} final results")
 
                             if result_count == 0:
-                                yield f"{StatusMessage.no_results()}"
+                                yield StatusMessage.no_results()
                             else:
                                 # Cache the entire sequence (serialize queries list)
                                 await redis_client.cache_query(
                                     nl_query=user_query,
-                                    sparql_query=json.dumps(sparql_queries)  # Store as JSON
+                                    sparql_query=sparql_query  # Store as JSON
                                 )
                         else:
-                            yield f"{StatusMessage.no_data()}"
-                            yield f"{StatusMessage.data_done()}"
+                            yield StatusMessage.no_data()
+                            yield StatusMessage.data_done()
                             return
 
                     except Exception as e:
                         logger.error(f"Sequential SPARQL execution error: {e}", exc_info=True)
                         is_sequential = False  # Fallback to no results
+                        sparql_query = ""
                         sparql_results = None
 
                 else:  # Single query
                     if sparql_query != "":
                         logger.info("stage2: executing single sparql")
-                        yield f"{StatusMessage.executing_query()}"
+                        yield StatusMessage.executing_query()
 
                         try:
-                            sparql_results = await virtuoso.execute_query(sparql_query)
+                            sparql_results, results_from_cache = await _execute_with_results_cache(
+                                redis_client,
+                                sparql_query,
+                                lambda: virtuoso.execute_query(sparql_query)
+                            )
 
                             # Check if we got results
-                            result_count = 0
-                            if sparql_results.get('results', {}).get('bindings'):
-                                result_count = len(sparql_results['results']['bindings'])
-                            elif sparql_results.get('boolean') is not None:
-                                result_count = 1
+                            result_count = _count_results(sparql_results)
 
                             span.set_attribute("result_count", result_count)
                             logger.info(f"SPARQL query returned {result_count} results")
 
                             if result_count == 0:
-                                yield f"{StatusMessage.no_results()}"
+                                yield StatusMessage.no_results()
                             else:
                                 # Cache successful query
                                 await redis_client.cache_query(
@@ -505,31 +731,48 @@ async def natural_language_query(request: NLQueryRequest):
 
                         except Exception as e:
                             logger.error(f"SPARQL execution error: {e}", exc_info=True)
-                            yield f"{StatusMessage.no_data()}"
-                            yield f"{StatusMessage.data_done()}"
+                            yield StatusMessage.no_data()
+                            yield StatusMessage.data_done()
                             return
 
                     else:
                         logger.warning("stage2: executing single sparql with an empty sparql")
-                        yield f"{StatusMessage.no_data()}"
-                        yield f"{StatusMessage.data_done()}"
+                        yield StatusMessage.no_data()
+                        yield StatusMessage.data_done()
                         return
 
-                if is_sequential and sparql_queries:
-                    sparql_query = json.dumps(sparql_queries)
-
                 if not sparql_query:
                     sparql_query = ""  # Ensure always defined
 
                 # Stage 3: Contextualize results with LLM
                 logger.info(f"Initiating stage 3 with results {sparql_results}")
-                yield f"{StatusMessage.processing_results()}"
+                yield StatusMessage.processing_results()
 
                 try:
-                    kv_results = convert_sparql_to_kv(sparql_results, sparql_query=sparql_query)
-                    formatted_results = format_for_llm(kv_results, max_items=10000)
-
-                    logger.info(f"Converted SPARQL to K/V format: {kv_results.get('result_type')}")
+                    # Cached results come with their formatting unless it was never stored
+                    formatted_results = None
+                    if results_from_cache:
+                        formatted_results = await redis_client.get_cached_formatted_results(sparql_query)
+
+                    if formatted_results is None:
+                        kv_results = convert_sparql_to_kv(sparql_results, sparql_query=sparql_query)
+
+                        # Trivial results (a single value or an ASK answer) are answered directly
+                        if settings.NL_SIMPLE_ANSWER_SHORTCIRCUIT:
+                            simple_answer = format_simple_answer(kv_results)
+                            if simple_answer is not None:
+                                span.set_attribute("simple_answer", True)
+                                yield simple_answer.encode() + _NL
+                                yield StatusMessage.data_done()
+                                return
+
+                        formatted_results = format_for_llm(kv_results, max_items=10000)
+
+                        # Only multi-row results are worth keeping; the rest format in no time
+                        if kv_results.get('result_type') == 'multiple':
+                            await redis_client.cache_formatted_results(sparql_query, formatted_results)
+
+                        logger.info(f"Converted SPARQL to K/V format: {kv_results.get('result_type')}")
                     logger.debug(f"Formatted results for LLM:\n{formatted_results}")
 
                     # Get the context stream from Ollama
@@ -542,7 +785,7 @@ async def natural_language_query(request: NLQueryRequest):
 
                     # Stream with timeout messages
                     async for chunk in _stream_with_timeout_messages(context_stream, timeout_seconds=300.0):
-                        yield f"{chunk}\n"
+                        yield chunk.encode() + _NL
 
                 except Exception as e:
                     logger.error(f"Contextualization error: {e}", exc_info=True)
@@ -551,13 +794,13 @@ async def natural_language_query(request: NLQueryRequest):
 
                 # Completion signal
                 logger.info(f"Pipeline was completed")
-                yield f"{StatusMessage.data_done()}"
+                yield StatusMessage.data_done()
 
             except Exception as e:
                 logger.error(f"Pipeline error: {e}", exc_info=True)
                 error_msg = StatusMessage.error(f"Unexpected error: {str(e)}")
                 yield f"{error_msg}\n"
-                yield f"{StatusMessage.data_done()}"
+                yield StatusMessage.data_done()
 
         return StreamingResponse(
             response_stream(),
@@ -570,7 +813,7 @@ async def natural_language_query(request: NLQueryRequest):
         )
 
 
-@router.get("/health")
+@router.get("/health", response_class=_ORJSONResponse)
 async def health_check():
     """Check if the Ollama service is available."""
     try:
@@ -594,7 +837,7 @@ async def health_check():
         }
 
 
-@router.get("/cache/stats")
+@router.get("/cache/stats", response_class=_ORJSONResponse)
 async def get_cache_stats():
     """Get cache statistics."""
     try:
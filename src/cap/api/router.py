@@ -11,7 +11,7 @@ from cap.api.models import (
     GraphResponse,
     SuccessResponse
 )
-from cap.data.virtuoso import VirtuosoClient
+from cap.data.virtuoso import get_virtuoso_client
 
 router = APIRouter(prefix="/api/v1")
 tracer = trace.get_tracer(__name__)
@@ -24,7 +24,7 @@ async def execute_query(request: QueryRequest):
     """Execute a SPARQL query."""
     with tracer.start_as_current_span("execute_query_endpoint") as span:
         span.set_attribute("query_type", request.type)
-        client = VirtuosoClient()
+        client = get_virtuoso_client()
         try:
             results = await client.execute_query(request.query)
             return QueryResponse(results=results)
@@ -39,7 +39,7 @@ async def create_graph(request: GraphCreateRequest):
     """Create a new graph with the provided Turtle data."""
     with tracer.start_as_current_span("create_graph_endpoint") as span:
         span.set_attribute("graph_uri", request.graph_uri)
-        client = VirtuosoClient()
+        client = get_virtuoso_client()
         try:
             success = await client.create_graph(request.graph_uri, request.turtle_data)
             return SuccessResponse(success=success)
@@ -56,7 +56,7 @@ async def read_graph(graph_uri: str):
         graph_uri = unquote_plus(graph_uri)
         logger.debug(f"[READ] Decoded graph_uri: {graph_uri}")
 
-        client = VirtuosoClient()
+        client = get_virtuoso_client()
         exists = await client.check_graph_exists(graph_uri)
         logger.debug(f"[READ] Graph exists check: {exists}")
 
@@ -80,7 +80,7 @@ async def update_graph(graph_uri: str, update_request: GraphUpdateRequest):
         graph_uri = unquote_plus(graph_uri)
         logger.debug(f"[UPDATE] Decoded graph_uri: {graph_uri}")
 
-        client = VirtuosoClient()
+        client = get_virtuoso_client()
         exists = await client.check_graph_exists(graph_uri)
         logger.debug(f"[UPDATE] Graph exists check: {exists}")
 
@@ -115,7 +115,7 @@ async def delete_graph(graph_uri: str):
         graph_uri = unquote_plus(graph_uri)
         logger.debug(f"[DELETE] Decoded graph_uri: {graph_uri}")
 
-        client = VirtuosoClient()
+        client = get_virtuoso_client()
         exists = await client.check_graph_exists(graph_uri)
         logger.debug(f"[DELETE] Graph exists check: {exists}")
 
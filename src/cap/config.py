@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     ETL_CONTINUOUS: bool
     ETL_PROGRESS_GRAPH: str
     ETL_PARALLEL_WORKERS: int
+    # Worker processes for CPU-bound transforms; batches larger than the threshold use them
+    ETL_TRANSFORM_WORKERS: int = 0
+    ETL_TRANSFORM_PARALLEL_THRESHOLD: int = 5000
 
     # Monitoring settings
     ENABLE_TRACING: bool
@@ -35,6 +38,10 @@ class Settings(BaseSettings):
     CAP_HOST: str
     CAP_PORT: int
 
+    # NL query settings
+    # Answer single-value and ASK results directly instead of contextualizing them with the LLM
+    NL_SIMPLE_ANSWER_SHORTCIRCUIT: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
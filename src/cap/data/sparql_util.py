@@ -5,7 +5,7 @@ Handles large integers (ADA amounts in lovelace) and nested structures
 Add this to virtuoso.py or create as a separate module (e.g., sparql_converter.py)
 """
 import logging
-from typing import Any
+from typing import Any, Optional
 from decimal import Decimal, InvalidOperation
 
 logger = logging.getLogger(__name__)
@@ -336,6 +336,30 @@ def format_for_llm(kv_data: dict[str, Any], max_items: int = 10000) -> str:
     return str(kv_data)
 
 
+def format_simple_answer(kv_data: dict[str, Any]) -> Optional[str]:
+    """
+    Format a trivial result (an ASK answer or a single value) as a direct answer.
+
+    Args:
+        kv_data: Key-value data from convert_sparql_to_kv
+
+    Returns:
+        Answer sentence, or None when the result needs LLM contextualization
+    """
+    result_type = kv_data.get('result_type')
+
+    if result_type == 'boolean':
+        return "Yes." if kv_data.get('value') else "No."
+
+    if result_type == 'single':
+        data = kv_data.get('data', {})
+        if len(data) == 1:
+            key, value = next(iter(data.items()))
+            return f"The {key.replace('_', ' ')} is {_format_value(value)}."
+
+    return None
+
+
 def _format_value(value: Any) -> str:
     """Format a value for display to LLM."""
     if isinstance(value, dict):
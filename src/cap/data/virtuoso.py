@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
-from SPARQLWrapper import SPARQLWrapper, JSON
+from SPARQLWrapper import SPARQLWrapper, GET, JSON, POST
 from opentelemetry import trace
 from fastapi import HTTPException
 
@@ -51,9 +51,7 @@ class VirtuosoConfig:
 class VirtuosoClient:
     def __init__(self, config: VirtuosoConfig | None = None):
         self.config = config or VirtuosoConfig()
-        self._sparql_wrapper = None
         self._http_client = None
-        self._initialize_sparql_wrapper()
 
     async def _get_http_client(self):
         """Get or create reusable HTTP client with optimized settings."""
@@ -76,13 +74,20 @@ class VirtuosoClient:
             await self._http_client.aclose()
             self._http_client = None
 
-    def _initialize_sparql_wrapper(self):
-        """Initialize the SPARQL wrapper with proper configuration."""
+    def _create_sparql_wrapper(self, method: str = GET) -> SPARQLWrapper:
+        """
+        Create a SPARQL wrapper with proper configuration.
+
+        SPARQLWrapper keeps the query and method as instance state, so every call gets
+        its own wrapper; the client is shared by concurrent requests.
+        """
         try:
-            self._sparql_wrapper = SPARQLWrapper(self.config.sparql_endpoint)
-            self._sparql_wrapper.setCredentials(self.config.username, self.config.password)
-            self._sparql_wrapper.setReturnFormat(JSON)
-            self._sparql_wrapper.setTimeout(self.config.query_timeout)
+            sparql_wrapper = SPARQLWrapper(self.config.sparql_endpoint)
+            sparql_wrapper.setCredentials(self.config.username, self.config.password)
+            sparql_wrapper.setReturnFormat(JSON)
+            sparql_wrapper.setTimeout(self.config.query_timeout)
+            sparql_wrapper.setMethod(method)
+            return sparql_wrapper
         except Exception as e:
             logger.error(f"Failed to initialize SPARQL wrapper: {e}")
             raise RuntimeError(f"SPARQL wrapper initialization failed: {e}")
@@ -101,7 +106,7 @@ class VirtuosoClient:
     def _build_sparql_prefixes(self, additional_prefixes: Optional[dict[str, str]] = None) -> str:
         return self._build_prefixes("PREFIX", DEFAULT_PREFIX, additional_prefixes)
 
-    async def _execute_sparql_query_async(self, query: str) -> dict:
+    async def _execute_sparql_query_async(self, query: str, method: str = GET) -> dict:
         """Execute SPARQL query asynchronously."""
 
         # If endpoint use plain HTTP GET
@@ -128,11 +133,9 @@ class VirtuosoClient:
 
         def _execute_sync():
             try:
-                if not self._sparql_wrapper:
-                    self._initialize_sparql_wrapper()
-
-                self._sparql_wrapper.setQuery(query)
-                result = self._sparql_wrapper.query()
+                sparql_wrapper = self._create_sparql_wrapper(method)
+                sparql_wrapper.setQuery(query)
+                result = sparql_wrapper.query()
                 return result.convert()
             except Exception as e:
                 logger.error(f"SPARQL query execution failed!")
@@ -151,7 +154,7 @@ class VirtuosoClient:
         self,
         method: str,
         graph_uri: str,
-        data: Optional[str] = None,
+        data: Optional[str | bytes] = None,
         headers: Optional[dict[str, str]] = None,
         additional_prefixes: Optional[dict[str, str]] = None
     ) -> bool:
@@ -186,8 +189,11 @@ class VirtuosoClient:
             try:
                 str_prefixes = self._build_turtle_prefixes(additional_prefixes)
 
-                # Prepare content
-                content = str_prefixes + data if data else str_prefixes
+                # Prepare content, keeping raw bytes undecoded
+                if isinstance(data, bytes):
+                    content = str_prefixes.encode() + data
+                else:
+                    content = str_prefixes + data if data else str_prefixes
 
                 # Make request with retry logic
                 max_retries = 3
@@ -252,7 +258,7 @@ class VirtuosoClient:
     async def create_graph(
             self,
             graph_uri: str,
-            turtle_data: str,
+            turtle_data: str | bytes,
             additional_prefixes: Optional[dict[str, str]] = None
     ) -> bool:
         """Create a new graph with the provided Turtle data."""
@@ -319,7 +325,6 @@ class VirtuosoClient:
                 raise ValueError("Either insert_data or delete_data must be provided")
 
             try:
-                self._sparql_wrapper.setMethod('POST')
                 prefixes = self._build_sparql_prefixes(additional_prefixes)
 
                 # Handle DELETE operation
@@ -346,7 +351,7 @@ class VirtuosoClient:
                         }}
                         """
 
-                    await self._execute_sparql_query_async(delete_query)
+                    await self._execute_sparql_query_async(delete_query, method=POST)
 
                 # Handle INSERT operation
                 if insert_data:
@@ -359,7 +364,7 @@ class VirtuosoClient:
                     }}
                     """
 
-                    await self._execute_sparql_query_async(insert_query)
+                    await self._execute_sparql_query_async(insert_query, method=POST)
 
                 return True
 
@@ -466,3 +471,23 @@ class VirtuosoClient:
                 span.set_attribute("error", str(e))
                 logger.error(f"Virtuoso connection test failed: {e}")
                 return False
+
+
+# Global client instance
+_virtuoso_client: Optional[VirtuosoClient] = None
+
+
+def get_virtuoso_client() -> VirtuosoClient:
+    """Get or create global Virtuoso client instance, reusing its connection pool across requests."""
+    global _virtuoso_client
+    if _virtuoso_client is None:
+        _virtuoso_client = VirtuosoClient()
+    return _virtuoso_client
+
+
+async def cleanup_virtuoso_client():
+    """Cleanup global Virtuoso client."""
+    global _virtuoso_client
+    if _virtuoso_client:
+        await _virtuoso_client.close()
+        _virtuoso_client = None
@@ -1,11 +1,11 @@
+from collections import defaultdict
 from typing import Any, Optional, Iterator
-from sqlalchemy.orm import selectinload
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, func, select
 from opentelemetry import trace
 import logging
 
-from cap.etl.cdb.extractors.extractor import BaseExtractor
-from cap.data.cdb_model import Block, SlotLeader, Tx
+from cap.etl.cdb.extractors.extractor import BaseExtractor, sql_hex, sql_isoformat
+from cap.data.cdb_model import Block, PoolHash, SlotLeader, Tx
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -17,74 +17,92 @@ class BlockExtractor(BaseExtractor):
         """Extract blocks in batches."""
         with tracer.start_as_current_span("block_extraction") as span:
             stmt = (
-                select(Block)
-                .options(
-                    selectinload(Block.slot_leader).selectinload(SlotLeader.pool_hash)
-                )
+                self._select_blocks()
+                .filter(Block.id > (last_processed_id or 0))
                 .order_by(Block.id)
+                .execution_options(stream_results=True, yield_per=self.batch_size)
             )
 
-            if last_processed_id:
-                stmt = stmt.filter(Block.id > last_processed_id)
-
-            # Pre-fetch transaction hashes in bulk
-            total_count = self.get_total_count()
-            for offset in range(0, total_count or 0, self.batch_size):
-                batch = self.db_session.execute(
-                    stmt.offset(offset).limit(self.batch_size)
-                ).scalars().all()
-
-                if not batch:
-                    break
-
+            # Server-side cursor: rows are fetched batch_size at a time
+            for batch in self.db_session.execute(stmt).partitions():
                 # Bulk fetch transactions for all blocks in batch
-                block_ids = [block.id for block in batch]
-                tx_map = {}
-                if block_ids:
-                    tx_stmt = select(Tx.block_id, Tx.hash).filter(Tx.block_id.in_(block_ids))
-                    txs = self.db_session.execute(tx_stmt).all()
-
-                    for block_id, tx_hash in txs:
-                        if block_id not in tx_map:
-                            tx_map[block_id] = []
-                        tx_map[block_id].append({'hash': tx_hash.hex(), 'epoch_no': None})
+                tx_map = self._fetch_tx_hashes([block.id for block in batch])
 
                 # Serialize with pre-fetched data
-                batch_data = []
-                for block in batch:
-                    serialized = self._serialize_block(block)
-                    serialized['transactions'] = tx_map.get(block.id, [])
-                    for tx in serialized['transactions']:
-                        tx['epoch_no'] = block.epoch_no
-                    batch_data.append(serialized)
+                batch_data = [
+                    self._serialize_block(block, tx_map.get(block.id, []))
+                    for block in batch
+                ]
 
                 span.set_attribute("batch_size", len(batch))
+                span.set_attribute("last_id", batch[-1].id)
+
                 yield batch_data
 
-    def _serialize_block(self, block: Block) -> dict[str, Any]:
-        """Serialize a block to dictionary."""
-        stmt = select(Tx).filter(Tx.block_id == block.id)
-        transactions = self.db_session.execute(stmt).scalars().all()
+    def extract_latest(self, limit: int) -> list[dict[str, Any]]:
+        """Extract the most recent blocks, newest first."""
+        stmt = self._select_blocks().order_by(Block.id.desc()).limit(limit)
+        rows = self.db_session.execute(stmt).all()
+
+        tx_map = self._fetch_tx_hashes([row.id for row in rows])
+        return [self._serialize_block(row, tx_map.get(row.id, [])) for row in rows]
+
+    def _select_blocks(self) -> Select:
+        """Select the plain columns a serialized block needs, without building ORM entities."""
+        return (
+            select(
+                Block.id,
+                sql_hex(Block.hash).label('hash'),
+                Block.epoch_no,
+                Block.slot_no,
+                Block.epoch_slot_no,
+                Block.block_no,
+                Block.previous_id,
+                Block.slot_leader_id,
+                Block.size,
+                sql_isoformat(Block.time).label('time'),
+                Block.tx_count,
+                Block.proto_major,
+                Block.proto_minor,
+                Block.vrf_key,
+                Block.op_cert_counter,
+                sql_hex(SlotLeader.hash).label('slot_leader_hash'),
+                PoolHash.view.label('pool_hash'),
+            )
+            .outerjoin(SlotLeader, Block.slot_leader_id == SlotLeader.id)
+            .outerjoin(PoolHash, SlotLeader.pool_hash_id == PoolHash.id)
+        )
+
+    def _fetch_tx_hashes(self, block_ids: list[int]) -> dict[int, list[str]]:
+        """Fetch transaction hashes for several blocks in a single query, grouped by block id."""
+        tx_map = defaultdict(list)
+        if block_ids:
+            tx_stmt = select(Tx.block_id, sql_hex(Tx.hash)).filter(Tx.block_id.in_(block_ids))
+            for block_id, tx_hash in self.db_session.execute(tx_stmt):
+                tx_map[block_id].append(tx_hash)
+        return tx_map
 
+    def _serialize_block(self, row: Row, tx_hashes: list[str]) -> dict[str, Any]:
+        """Serialize a block row to dictionary using its pre-fetched transaction hashes."""
         return {
-            'id': block.id,
-            'hash': block.hash.hex() if block.hash else None,
-            'epoch_no': block.epoch_no,
-            'slot_no': block.slot_no,
-            'epoch_slot_no': block.epoch_slot_no,
-            'block_no': block.block_no,
-            'previous_id': block.previous_id,
-            'slot_leader_id': block.slot_leader_id,
-            'slot_leader_hash': block.slot_leader.hash.hex() if block.slot_leader and block.slot_leader.hash else None,
-            'pool_hash': block.slot_leader.pool_hash.view if block.slot_leader and block.slot_leader.pool_hash else None,
-            'size': block.size,
-            'time': block.time.isoformat() if block.time else None,
-            'tx_count': block.tx_count,
-            'proto_major': block.proto_major,
-            'proto_minor': block.proto_minor,
-            'vrf_key': block.vrf_key,
-            'op_cert_counter': block.op_cert_counter,
-            'transactions': [{'hash': tx.hash.hex(), 'epoch_no': block.epoch_no} for tx in transactions]
+            'id': row.id,
+            'hash': row.hash,
+            'epoch_no': row.epoch_no,
+            'slot_no': row.slot_no,
+            'epoch_slot_no': row.epoch_slot_no,
+            'block_no': row.block_no,
+            'previous_id': row.previous_id,
+            'slot_leader_id': row.slot_leader_id,
+            'slot_leader_hash': row.slot_leader_hash,
+            'pool_hash': row.pool_hash,
+            'size': row.size,
+            'time': row.time,
+            'tx_count': row.tx_count,
+            'proto_major': row.proto_major,
+            'proto_minor': row.proto_minor,
+            'vrf_key': row.vrf_key,
+            'op_cert_counter': row.op_cert_counter,
+            'transactions': [{'hash': tx_hash, 'epoch_no': row.epoch_no} for tx_hash in tx_hashes]
         }
 
     def get_total_count(self) -> int:
@@ -1,9 +1,9 @@
 from typing import Any, Optional, Iterator
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from opentelemetry import trace
 import logging
 
-from cap.etl.cdb.extractors.extractor import BaseExtractor
+from cap.etl.cdb.extractors.extractor import BaseExtractor, sql_isoformat
 from cap.data.cdb_model import Epoch
 
 logger = logging.getLogger(__name__)
@@ -15,28 +15,31 @@ class EpochExtractor(BaseExtractor):
     def extract_batch(self, last_processed_id: Optional[int] = None) -> Iterator[list[dict[str, Any]]]:
         """Extract epochs in batches."""
         with tracer.start_as_current_span("epoch_extraction") as span:
-            stmt = select(Epoch).order_by(Epoch.id)
-
-            if last_processed_id:
-                stmt = stmt.filter(Epoch.id > last_processed_id)
-
-            offset = 0
-            while True:
-                batch = self.db_session.execute(
-                    stmt.offset(offset).limit(self.batch_size)
-                ).scalars().all()
-
-                if not batch:
-                    break
-
+            stmt = (
+                select(
+                    Epoch.id,
+                    Epoch.no,
+                    Epoch.out_sum,
+                    Epoch.fees,
+                    Epoch.tx_count,
+                    Epoch.blk_count,
+                    sql_isoformat(Epoch.start_time).label('start_time'),
+                    sql_isoformat(Epoch.end_time).label('end_time'),
+                )
+                .filter(Epoch.id > (last_processed_id or 0))
+                .order_by(Epoch.id)
+                .execution_options(stream_results=True, yield_per=self.batch_size)
+            )
+
+            # Server-side cursor: rows are fetched batch_size at a time
+            for batch in self.db_session.execute(stmt).partitions():
                 span.set_attribute("batch_size", len(batch))
-                span.set_attribute("offset", offset)
+                span.set_attribute("last_id", batch[-1].id)
 
                 yield [self._serialize_epoch(epoch) for epoch in batch]
-                offset += self.batch_size
 
-    def _serialize_epoch(self, epoch: Epoch) -> dict[str, Any]:
-        """Serialize epoch to dictionary."""
+    def _serialize_epoch(self, epoch: Row) -> dict[str, Any]:
+        """Serialize an epoch row (timestamps already ISO-formatted) to dictionary."""
         return {
             'id': epoch.id,
             'no': epoch.no,
@@ -44,8 +47,8 @@ class EpochExtractor(BaseExtractor):
             'fees': str(epoch.fees) if epoch.fees else None,
             'tx_count': epoch.tx_count,
             'blk_count': epoch.blk_count,
-            'start_time': epoch.start_time.isoformat() if epoch.start_time else None,
-            'end_time': epoch.end_time.isoformat() if epoch.end_time else None
+            'start_time': epoch.start_time,
+            'end_time': epoch.end_time
         }
 
     def get_total_count(self) -> int:
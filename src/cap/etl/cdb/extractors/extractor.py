@@ -5,7 +5,20 @@ Each extractor handles specific data extraction from PostgreSQL.
 
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Iterator
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+# Matches datetime.isoformat() for second-precision timestamps
+ISO_TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS'
+
+def sql_hex(column: ColumnElement) -> ColumnElement:
+    """Hex-encode a bytea column in Postgres rather than calling bytes.hex() per row."""
+    return func.encode(column, 'hex')
+
+def sql_isoformat(column: ColumnElement) -> ColumnElement:
+    """Format a timestamp column as ISO 8601 in Postgres rather than in Python per row."""
+    return func.to_char(column, ISO_TIMESTAMP_FORMAT)
 
 class BaseExtractor(ABC):
     """Base class for all data extractors."""
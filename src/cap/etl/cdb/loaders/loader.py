@@ -6,16 +6,24 @@ Handles loading transformed RDF data into Virtuoso triplestore.
 import logging
 import asyncio
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
 
 from opentelemetry import trace
 
 from cap.data.virtuoso import VirtuosoClient, DEFAULT_PREFIX
 from cap.config import settings
+from cap.telemetry import maybe_span
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+def _grouped(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Yield consecutive groups of at most size items."""
+    iterator = iter(items)
+    while group := list(islice(iterator, size)):
+        yield group
+
 class CDBLoader:
     """Data loader for Cardano blockchain data to Virtuoso triplestore."""
 
@@ -26,7 +34,7 @@ class CDBLoader:
     async def load_batch(
             self,
             graph_uri: str,
-            turtle_data: str,
+            turtle_data: Union[str, Iterable[str]],
             batch_info: dict = None,
             additional_prefixes: Optional[dict[str, str]] = None
     ) -> bool:
@@ -35,80 +43,42 @@ class CDBLoader:
 
         Args:
             graph_uri: URI of the target graph
-            turtle_data: RDF data in Turtle format
+            turtle_data: RDF data in Turtle format, or an iterable of Turtle blocks that each
+                hold complete statements (as produced by a transformer's iter_transform)
             batch_info: Additional information about the batch
             additional_prefixes: Additional prefixes if needed in the update_graph query
 
         Returns:
             bool: Success status
         """
-        with tracer.start_as_current_span("etl_load_batch") as span:
+        with maybe_span(tracer, "etl_load_batch") as span:
             span.set_attribute("graph_uri", graph_uri)
             if batch_info:
                 span.set_attribute("batch_size", batch_info.get("size", 0))
                 span.set_attribute("entity_type", batch_info.get("entity_type", "unknown"))
 
             try:
-                # Validate turtle data
-                if not turtle_data or not turtle_data.strip():
-                    logger.warning("Empty turtle data provided for loading")
-                    return True
-
-                # Split large turtle data into chunks
-                lines = turtle_data.strip().split('\n')
-
-                # Separate prefixes and data
-                prefix_lines = []
-                data_lines = []
-                for line in lines:
-                    line_stripped = line.strip()
-                    if line_stripped.startswith('PREFIX') or line.strip().startswith('@prefix'):
-                        prefix_lines.append(line)
-                    elif line_stripped:
-                        data_lines.append(line)
-
-                # Process in chunks, ensuring we break at complete statements
-                chunk_size = 1000
-                prefixes = '\n'.join(prefix_lines) + '\n' if prefix_lines else ''
-
-                chunks = []
-                i = 0
-                chunk_num = 1
-                while i < len(data_lines):
-                    # Find the end of chunk at nearest complete statement
-                    end_idx = min(i + chunk_size, len(data_lines))
-
-                    # If not at the end of all data, find the last complete statement
-                    if end_idx < len(data_lines):
-                        # Look for the last line ending with '.'
-                        while end_idx > i and not data_lines[end_idx - 1].strip().endswith('.'):
-                            end_idx -= 1
-
-                        # If we couldn't find a '.', we need to look forward
-                        if end_idx == i:
-                            end_idx = i + chunk_size
-                            while end_idx < len(data_lines) and not data_lines[end_idx - 1].strip().endswith('.'):
-                                end_idx += 1
-
-                    chunk_lines = data_lines[i:end_idx]
-                    chunk_data = prefixes + '\n'.join(chunk_lines)
-                    chunks.append((chunk_data, chunk_num))
-
-                    i = end_idx
-                    chunk_num += 1
-
-                load_tasks = []
-                for chunk_data, chunk_num in chunks:
-                    task = self._load_to_virtuoso(graph_uri, chunk_data, additional_prefixes=additional_prefixes)
-                    load_tasks.append(task)
-
-                # Process in batches of 4 to avoid overwhelming Virtuoso
-                for i in range(0, len(load_tasks), 4):
-                    batch_tasks = load_tasks[i:i+4]
-                    await asyncio.gather(*batch_tasks)
-                    logger.debug(f"Loaded chunks {i+1} to {min(i+4, len(load_tasks))} of {len(load_tasks)}")
-
-                logger.debug(f"Successfully loaded all {len(chunks)} chunks to graph: {graph_uri}")
+                if isinstance(turtle_data, str):
+                    # Validate turtle data
+                    if not turtle_data or not turtle_data.strip():
+                        logger.warning("Empty turtle data provided for loading")
+                        return True
+                    chunks = self._chunk_turtle(turtle_data)
+                else:
+                    chunks = self._chunk_blocks(turtle_data)
+
+                # Chunks are built lazily; load them in groups of 4 to avoid overwhelming Virtuoso
+                chunk_count = 0
+                for group in _grouped(chunks, 4):
+                    await asyncio.gather(*(
+                        self._load_to_virtuoso(graph_uri, chunk_data, additional_prefixes=additional_prefixes)
+                        for chunk_data in group
+                    ))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Loaded chunks {chunk_count + 1} to {chunk_count + len(group)}")
+                    chunk_count += len(group)
+
+                logger.debug(f"Successfully loaded all {chunk_count} chunks to graph: {graph_uri}")
                 return True
 
             except Exception as e:
@@ -116,6 +86,67 @@ class CDBLoader:
                 span.set_attribute("error", str(e))
                 raise
 
+    def _chunk_turtle(self, turtle_data: str, chunk_size: int = 1000) -> Iterator[str]:
+        """Split Turtle text into chunks of about chunk_size lines, breaking at complete statements."""
+        # Split large turtle data into chunks
+        lines = turtle_data.strip().split('\n')
+
+        # Separate prefixes and data
+        prefix_lines = []
+        data_lines = []
+        for line in lines:
+            line_stripped = line.strip()
+            if line_stripped.startswith('PREFIX') or line.strip().startswith('@prefix'):
+                prefix_lines.append(line)
+            elif line_stripped:
+                data_lines.append(line)
+
+        # Process in chunks, ensuring we break at complete statements
+        prefixes = '\n'.join(prefix_lines) + '\n' if prefix_lines else ''
+
+        i = 0
+        while i < len(data_lines):
+            # Find the end of chunk at nearest complete statement
+            end_idx = min(i + chunk_size, len(data_lines))
+
+            # If not at the end of all data, find the last complete statement
+            if end_idx < len(data_lines):
+                # Look for the last line ending with '.'
+                while end_idx > i and not data_lines[end_idx - 1].strip().endswith('.'):
+                    end_idx -= 1
+
+                # If we couldn't find a '.', we need to look forward
+                if end_idx == i:
+                    end_idx = i + chunk_size
+                    while end_idx < len(data_lines) and not data_lines[end_idx - 1].strip().endswith('.'):
+                        end_idx += 1
+
+            chunk_lines = data_lines[i:end_idx]
+            yield prefixes + '\n'.join(chunk_lines)
+
+            i = end_idx
+
+    def _chunk_blocks(self, blocks: Iterable[str], chunk_size: int = 1000) -> Iterator[str]:
+        """
+        Merge Turtle blocks into chunks of about chunk_size lines.
+
+        Every block holds complete statements, so chunks can end after any block without
+        scanning for statement terminators.
+        """
+        chunk: list[str] = []
+        chunk_lines = 0
+        for block in blocks:
+            if not block.strip():
+                continue
+            chunk.append(block)
+            chunk_lines += block.count('\n') + 1
+            if chunk_lines >= chunk_size:
+                yield '\n'.join(chunk)
+                chunk = []
+                chunk_lines = 0
+        if chunk:
+            yield '\n'.join(chunk)
+
     async def _load_to_virtuoso(
             self,
             graph_uri: str,
@@ -123,7 +154,7 @@ class CDBLoader:
             additional_prefixes: Optional[dict[str, str]] = None):
 
         """Load RDF data to Virtuoso triplestore."""
-        with tracer.start_as_current_span("etl_load_virtuoso") as span:
+        with maybe_span(tracer, "etl_load_virtuoso") as span:
             span.set_attribute("graph_uri", graph_uri)
             span.set_attribute("data_size", len(turtle_data))
 
@@ -139,7 +170,8 @@ class CDBLoader:
                     )
                 else:
                     # Insert data into existing graph
-                    logger.debug(f"Inserting data into existing graph: {graph_uri}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Inserting data into existing graph: {graph_uri}")
                     await self.virtuoso_client.update_graph(
                         graph_uri,
                         insert_data=turtle_data,
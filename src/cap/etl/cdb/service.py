@@ -3,7 +3,7 @@ ETL pipeline service for syncing cardano-db-sync data to Virtuoso triplestore.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import logging
 from typing import Optional
@@ -19,8 +19,8 @@ from cap.data.virtuoso import VirtuosoClient
 from cap.config import settings
 from cap.etl.cdb.extractor_factory import ExtractorFactory
 from cap.etl.cdb.transformer_factory import TransformerFactory
+from cap.etl.cdb.transformers.transformer import create_transform_executor
 from cap.etl.cdb.loaders.loader import CDBLoader
-from cap.data.cdb_model import Block
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -58,6 +58,9 @@ class ETLPipeline:
         self.running = False
         self.progress: dict[str, ETLProgress] = {}
 
+        # Worker processes for large transforms, created for the duration of start_sync
+        self.transform_executor: Optional[ProcessPoolExecutor] = None
+
         # Database connections
         try:
             self.pg_engine = create_engine(
@@ -149,6 +152,9 @@ class ETLPipeline:
             logger.info("Starting ETL pipeline sync...")
             self.running = True
 
+            if settings.ETL_TRANSFORM_WORKERS > 1:
+                self.transform_executor = create_transform_executor(settings.ETL_TRANSFORM_WORKERS)
+
             try:
                 # Load existing progress from Virtuoso
                 await self._load_existing_progress()
@@ -172,6 +178,9 @@ class ETLPipeline:
                 raise
             finally:
                 self.running = False
+                if self.transform_executor:
+                    self.transform_executor.shutdown(wait=False, cancel_futures=True)
+                    self.transform_executor = None
                 logger.info("ETL pipeline stopped")
 
     async def stop_sync(self):
@@ -358,8 +367,14 @@ class ETLPipeline:
                         break
 
                     try:
-                        # Transform to RDF
-                        turtle_data = transformer.transform(batch)
+                        # Transform to RDF, in worker processes for large batches and
+                        # otherwise streamed block by block into the loader
+                        if self.transform_executor and len(batch) > settings.ETL_TRANSFORM_PARALLEL_THRESHOLD:
+                            turtle_data = transformer.transform_parallel(
+                                batch, settings.ETL_TRANSFORM_WORKERS, self.transform_executor
+                            )
+                        else:
+                            turtle_data = transformer.iter_transform(batch)
 
                         # Load to Virtuoso
                         graph_uri = settings.CARDANO_GRAPH
@@ -409,8 +424,9 @@ class ETLPipeline:
                                 f"{settings.CARDANO_GRAPH}/metadata"
                             )
 
-                        logger.debug(f"Processed batch {batch_count} for {entity_type} "
-                                f"({len(batch)} records, total: {progress.processed_records})")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Processed batch {batch_count} for {entity_type} "
+                                    f"({len(batch)} records, total: {progress.processed_records})")
 
                     except Exception as e:
                         logger.error(f"Error processing batch {batch_count} for {entity_type}: {e}")
@@ -510,36 +526,27 @@ class ETLPipeline:
 
             try:
                 with self.pg_session_factory() as db_session:
-                    # Get latest blocks
-                    latest_blocks = (
-                        db_session.query(Block)
-                        .order_by(Block.id.desc())
-                        .limit(limit)
-                        .all()
-                    )
-
-                    if latest_blocks:
-                        # Transform and load
-                        extractor = ExtractorFactory.create_extractor('block', db_session, self.batch_size)
-                        transformer = TransformerFactory.create_transformer('block')
+                    extractor = ExtractorFactory.create_extractor('block', db_session, self.batch_size)
+                    transformer = TransformerFactory.create_transformer('block')
 
-                        # Serialize blocks
-                        block_data = [extractor._serialize_block(block) for block in latest_blocks]
+                    # Get and serialize latest blocks
+                    block_data = extractor.extract_latest(limit)
 
-                        # Transform to RDF
-                        turtle_data = transformer.transform(block_data)
+                    if block_data:
+                        # Transform to RDF, streamed block by block into the loader
+                        turtle_data = transformer.iter_transform(block_data)
 
                         # Load to Virtuoso - use main graph
                         batch_info = {
                             "entity_type": "block",
-                            "size": len(latest_blocks),
+                            "size": len(block_data),
                             "sync_type": "latest"
                         }
 
                         await self.loader.load_batch(settings.CARDANO_GRAPH, turtle_data, batch_info)
 
-                        logger.info(f"Synced {len(latest_blocks)} latest blocks")
-                        return len(latest_blocks)
+                        logger.info(f"Synced {len(block_data)} latest blocks")
+                        return len(block_data)
                     else:
                         logger.info("No new blocks to sync")
                         return 0
@@ -1,19 +1,15 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
 from cap.etl.cdb.transformers.transformer import BaseTransformer
 
-logger = logging.getLogger(__name__)
-
 class AccountTransformer(BaseTransformer):
     """Transforms account balance data to RDF aligned with Cardano ontology."""
 
-    def transform(self, accounts: list[dict[str, Any]]) -> str:
+    def iter_transform(self, accounts: list[dict[str, Any]]) -> Iterator[str]:
         """Transform account balances to RDF Turtle format."""
-        turtle_lines = []
-        turtle_lines_append = turtle_lines.append
-
         for account in accounts:
+            turtle_lines: list[str] = []
+            turtle_lines_append = turtle_lines.append
             account_uri = self.create_stake_address_uri(account['stake_address'])
 
             acc_lines = [
@@ -66,4 +62,4 @@ class AccountTransformer(BaseTransformer):
 
             turtle_lines_append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
@@ -1,18 +1,14 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
 from cap.etl.cdb.transformers.transformer import BaseTransformer
 
-logger = logging.getLogger(__name__)
-
 class BlockTransformer(BaseTransformer):
     """Transformer for block data aligned with Cardano ontology."""
 
-    def transform(self, blocks: list[dict[str, Any]]) -> str:
+    def iter_transform(self, blocks: list[dict[str, Any]]) -> Iterator[str]:
         """Transform blocks to RDF Turtle format with complete ontology coverage."""
-        turtle_lines = []
-
         for block in blocks:
+            turtle_lines = []
             block_uri = self.create_block_uri(block['hash'])
 
             turtle_lines.append(f"{block_uri} a blockchain:Block ;")
@@ -87,4 +83,4 @@ class BlockTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
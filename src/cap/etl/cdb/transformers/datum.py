@@ -1,51 +1,50 @@
-import logging
 import json
-from typing import Any
+import orjson
+from typing import Any, Iterator
 
-from cap.etl.cdb.transformers.transformer import BaseTransformer
-
-logger = logging.getLogger(__name__)
+from cap.etl.cdb.transformers.transformer import BaseTransformer, memoized
 
 class DatumTransformer(BaseTransformer):
     """Transforms datum data to RDF aligned with Cardano ontology."""
 
-    def transform(self, datums: list[dict[str, Any]]) -> str:
+    def iter_transform(self, datums: list[dict[str, Any]]) -> Iterator[str]:
         """Transform datums to RDF Turtle format."""
-        turtle_lines = []
+        transaction_uri = memoized(self.create_transaction_uri)
 
         for datum in datums:
+            turtle_lines = []
             datum_uri = self.create_uri('datum', datum['hash'])
 
-            # Datum as cardano:Datum
-            turtle_lines.append(f"{datum_uri} a cardano:Datum ;")
+            preds = []
 
             if datum['hash']:
-                turtle_lines.append(f"    blockchain:hasHash \"{datum['hash']}\" ;")
+                preds.append(f"blockchain:hasHash \"{datum['hash']}\"")
 
             if datum['value'] is not None:
                 # Handle the case where value might be a dict or string
                 if isinstance(datum['value'], dict):
-                    # Convert dict to JSON string
-                    value_str = json.dumps(datum['value'])
+                    # Convert dict to compact JSON string
+                    try:
+                        value_str = orjson.dumps(datum['value'], option=orjson.OPT_NON_STR_KEYS).decode()
+                    except TypeError:
+                        # orjson rejects integers beyond 64 bits, which Plutus datums can hold
+                        value_str = json.dumps(datum['value'], ensure_ascii=False, separators=(',', ':'))
                 else:
                     # It's already a string
                     value_str = str(datum['value'])
 
-                # Now escape the string
-                escaped_value = value_str.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                turtle_lines.append(f"    cardano:hasDatumContent {self.format_literal(escaped_value)} ;")
+                # format_literal escapes the string
+                preds.append(f"cardano:hasDatumContent {self.format_literal(value_str)}")
 
             if datum['bytes']:
-                turtle_lines.append(f"    cardano:hasDatumBytes \"{datum['bytes']}\" ;")
+                preds.append(f"cardano:hasDatumBytes \"{datum['bytes']}\"")
 
             if datum['tx_hash']:
-                tx_uri = self.create_transaction_uri(datum['tx_hash'])
-                turtle_lines.append(f"    cardano:datumEmbeddedIn {tx_uri} ;")
-
-            # Remove trailing semicolon and add period
-            if turtle_lines and turtle_lines[-1].endswith(' ;'):
-                turtle_lines[-1] = turtle_lines[-1][:-2] + ' .'
+                tx_uri = transaction_uri(datum['tx_hash'])
+                preds.append(f"cardano:datumEmbeddedIn {tx_uri}")
 
+            # Datum as cardano:Datum
+            turtle_lines.append(self._emit(datum_uri, 'cardano:Datum', preds))
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
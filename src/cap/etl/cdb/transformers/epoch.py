@@ -1,18 +1,14 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
 from cap.etl.cdb.transformers.transformer import BaseTransformer
 
-logger = logging.getLogger(__name__)
-
 class EpochTransformer(BaseTransformer):
     """Transforms epoch data to RDF aligned with Cardano ontology."""
 
-    def transform(self, epochs: list[dict[str, Any]]) -> str:
+    def iter_transform(self, epochs: list[dict[str, Any]]) -> Iterator[str]:
         """Transform epochs to RDF Turtle format."""
-        turtle_lines = []
-
         for epoch in epochs:
+            turtle_lines = []
             epoch_uri = self.create_epoch_uri(epoch['no'])
 
             # Epoch as cardano:Epoch
@@ -35,4 +31,4 @@ class EpochTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
@@ -1,18 +1,14 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
 from cap.etl.cdb.transformers.transformer import BaseTransformer
 
-logger = logging.getLogger(__name__)
-
 class GovernanceTransformer(BaseTransformer):
     """Transforms governance data to RDF aligned with Cardano ontology."""
 
-    def transform(self, governance_actions: list[dict[str, Any]]) -> str:
+    def iter_transform(self, governance_actions: list[dict[str, Any]]) -> Iterator[str]:
         """Transform governance actions to RDF Turtle format."""
-        turtle_lines = []
-
         for action in governance_actions:
+            turtle_lines = []
             action_uri = self.create_uri('governance_action', action['id'])
 
             # Governance Action entity
@@ -78,16 +74,15 @@ class GovernanceTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
+            yield '\n'.join(turtle_lines)
 
 class DRepTransformer(BaseTransformer):
     """Transforms DRep data to RDF aligned with Cardano ontology."""
 
-    def transform(self, drep_registrations: list[dict[str, Any]]) -> str:
+    def iter_transform(self, drep_registrations: list[dict[str, Any]]) -> Iterator[str]:
         """Transform DRep registrations to RDF Turtle format."""
-        turtle_lines = []
-
         for drep_reg in drep_registrations:
+            turtle_lines = []
             drep_uri = self.create_uri('drep', drep_reg['drep_hash'])
             registration_uri = self.create_uri('drep_registration', drep_reg['id'])
 
@@ -107,26 +102,22 @@ class DRepTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
+            yield '\n'.join(turtle_lines)
 
 class TreasuryTransformer(BaseTransformer):
     """Transforms treasury and reserve data to RDF aligned with Cardano ontology."""
 
-    def transform(self, treasury_data: list[dict[str, Any]]) -> str:
+    def iter_transform(self, treasury_data: list[dict[str, Any]]) -> Iterator[str]:
         """Transform treasury and reserve movements to RDF Turtle format."""
-        turtle_lines = []
-
         for item in treasury_data:
             item_type = item['type']
 
             if item_type == 'treasury':
-                turtle_lines.extend(self._transform_treasury(item))
+                yield '\n'.join(self._transform_treasury(item))
             elif item_type == 'reserve':
-                turtle_lines.extend(self._transform_reserve(item))
+                yield '\n'.join(self._transform_reserve(item))
             elif item_type == 'pot_transfer':
-                turtle_lines.extend(self._transform_pot_transfer(item))
-
-        return '\n'.join(turtle_lines)
+                yield '\n'.join(self._transform_pot_transfer(item))
 
     def _transform_treasury(self, treasury: dict[str, Any]) -> list[str]:
         """Transform treasury movement to RDF."""
@@ -1,18 +1,14 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
-from cap.etl.cdb.transformers.transformer import BaseTransformer
-
-logger = logging.getLogger(__name__)
+from cap.etl.cdb.transformers.transformer import BaseTransformer, escape_turtle_string
 
 class MultiAssetTransformer(BaseTransformer):
     """Transforms multi-asset (native token) data to RDF aligned with Cardano ontology."""
 
-    def transform(self, assets: list[dict[str, Any]]) -> str:
+    def iter_transform(self, assets: list[dict[str, Any]]) -> Iterator[str]:
         """Transform multi-assets to RDF Turtle format."""
-        turtle_lines = []
-
         for asset in assets:
+            turtle_lines = []
             asset_uri = self.create_uri('native_token', asset['fingerprint'])
 
             # Asset as cardano:CNT
@@ -27,7 +23,7 @@ class MultiAssetTransformer(BaseTransformer):
 
             if asset['name']:
                 # Escape the name properly
-                escaped_name = asset['name'].replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+                escaped_name = escape_turtle_string(asset['name'])
                 turtle_lines.append(f"    blockchain:hasTokenName \"{escaped_name}\" ;")
 
             # Remove trailing semicolon and add period
@@ -36,4 +32,4 @@ class MultiAssetTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
+            yield '\n'.join(turtle_lines)
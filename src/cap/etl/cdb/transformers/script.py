@@ -1,18 +1,14 @@
-import logging
-from typing import Any
+from typing import Any, Iterator
 
 from cap.etl.cdb.transformers.transformer import BaseTransformer
 
-logger = logging.getLogger(__name__)
-
 class ScriptTransformer(BaseTransformer):
     """Transforms script data to RDF aligned with Cardano ontology."""
 
-    def transform(self, scripts: list[dict[str, Any]]) -> str:
+    def iter_transform(self, scripts: list[dict[str, Any]]) -> Iterator[str]:
         """Transform scripts to RDF Turtle format."""
-        turtle_lines = []
-
         for script in scripts:
+            turtle_lines = []
             script_uri = self.create_uri('script', script['hash'])
 
             # Determine script type
@@ -53,4 +49,4 @@ class ScriptTransformer(BaseTransformer):
 
                 turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
@@ -1,51 +1,70 @@
-import logging
-from typing import Any
-
-from cap.etl.cdb.transformers.transformer import BaseTransformer
-
-logger = logging.getLogger(__name__)
+from typing import Any, Iterator
+
+from cap.etl.cdb.transformers.transformer import BaseTransformer, ada_amount_block, emit_templates, memoized
+
+# Account blocks indexed by a bitmask of present fields
+_ACCOUNT_VIEW = 1
+_ACCOUNT_HASH = 2
+_ACCOUNT_STAKE = 4
+_ACCOUNT_TEMPLATES = emit_templates('blockchain:Account', (
+    'blockchain:hasAccountAddress "%s"',
+    'blockchain:hasHash "%s"',
+    'cardano:hasStakeAmount %s',
+))
+
+# Reward blocks, between the account link and the amount entity, indexed by a bitmask of
+# present predicates; every reward has an amount
+_REWARD_AMOUNT = 1
+_REWARD_TYPE = 2
+_REWARD_TEMPLATES = tuple(
+    "%s cardano:hasReward %s .\n" + template + "\n\n" + ada_amount_block('%s', '%s')
+    for template in emit_templates('cardano:Reward', (
+        'cardano:hasRewardAmount %s',
+        'cardano:hasRewardType "%s"',
+    ))
+)
+_REWARD_WITH_TYPE_TEMPLATE = _REWARD_TEMPLATES[_REWARD_AMOUNT | _REWARD_TYPE]
+_REWARD_WITHOUT_TYPE_TEMPLATE = _REWARD_TEMPLATES[_REWARD_AMOUNT]
 
 class StakePoolTransformer(BaseTransformer):
     """Transformer for stake pool data aligned with Cardano ontology."""
 
-    def transform(self, pools: list[dict[str, Any]]) -> str:
+    def iter_transform(self, pools: list[dict[str, Any]]) -> Iterator[str]:
         """Transform stake pools to RDF Turtle format with complete coverage."""
-        turtle_lines = []
-        turtle_lines_append = turtle_lines.append
+        stake_address_uri = memoized(self.create_stake_address_uri)
 
         for pool in pools:
+            turtle_lines: list[str] = []
+            turtle_lines_append = turtle_lines.append
             pool_uri = self.create_pool_uri(pool['pool_hash'])
 
-            pool_lines = [f"{pool_uri} a cardano:StakePool ;"]
+            preds = []
 
             if pool['pool_hash']:
-                pool_lines.append(f"    blockchain:hasHash \"{pool['pool_hash']}\" ;")
+                preds.append(f"blockchain:hasHash \"{pool['pool_hash']}\"")
 
             if pool['pledge']:
-                pool_lines.append(f"    cardano:hasPoolPledge {self.create_amount_literal(pool['pledge'])} ;")
+                preds.append(f"cardano:hasPoolPledge {self.create_amount_literal(pool['pledge'])}")
 
             if pool['margin'] is not None:
-                pool_lines.append(f"    cardano:hasMargin {self.format_literal(pool['margin'], 'xsd:decimal')} ;")
+                preds.append(f"cardano:hasMargin {self.format_literal(pool['margin'], 'xsd:decimal')}")
 
             if pool['fixed_cost']:
-                pool_lines.append(f"    cardano:hasFixedCost {self.create_amount_literal(pool['fixed_cost'])} ;")
+                preds.append(f"cardano:hasFixedCost {self.create_amount_literal(pool['fixed_cost'])}")
 
             if pool['reward_addr']:
-                reward_addr_uri = self.create_stake_address_uri(pool['reward_addr'])
-                pool_lines.append(f"    cardano:hasStakeAccount {reward_addr_uri} ;")
+                reward_addr_uri = stake_address_uri(pool['reward_addr'])
+                preds.append(f"cardano:hasStakeAccount {reward_addr_uri}")
 
             if pool['metadata_url']:
                 metadata_uri = self.create_uri('pool_metadata', pool['id'])
-                pool_lines.append(f"    cardano:hasPoolMetadata {metadata_uri} ;")
+                preds.append(f"cardano:hasPoolMetadata {metadata_uri}")
 
             if pool.get('retirement_epoch'):
                 retirement_uri = self.create_uri('pool_retirement', pool['id'])
-                pool_lines.append(f"    cardano:hasRetirement {retirement_uri} ;")
-
-            pool_lines[-1] = pool_lines[-1][:-2] + ' .'
+                preds.append(f"cardano:hasRetirement {retirement_uri}")
 
-            for line in pool_lines:
-                turtle_lines_append(line)
+            turtle_lines_append(self._emit(pool_uri, 'cardano:StakePool', preds))
             turtle_lines_append("")
 
             # Add metadata entity
@@ -60,47 +79,54 @@ class StakePoolTransformer(BaseTransformer):
                 turtle_lines_append(f"{retirement_uri} a cardano:PoolRetirement .")
                 turtle_lines_append("")
 
-        return '\n'.join(turtle_lines)
+            yield '\n'.join(turtle_lines)
 
 class StakeAddressTransformer(BaseTransformer):
     """Transformer for stake address data."""
 
-    def transform(self, stake_addresses: list[dict[str, Any]]) -> str:
+    def iter_transform(self, stake_addresses: list[dict[str, Any]]) -> Iterator[str]:
         """Transform stake addresses to RDF Turtle format."""
-        turtle_lines = []
-
         for addr in stake_addresses:
-            addr_uri = self.create_stake_address_uri(addr['view'])
-
-            turtle_lines.append(f"{addr_uri} a blockchain:Account ;")
-
-            if addr['view']:
-                turtle_lines.append(f"    blockchain:hasAccountAddress \"{addr['view']}\" ;")
-
-            if addr['hash_raw']:
-                turtle_lines.append(f"    blockchain:hasHash \"{addr['hash_raw']}\" ;")
-
-            if addr.get('stake_amount') and addr['stake_amount'] > 0:
-                turtle_lines.append(f"    cardano:hasStakeAmount {self.format_literal(addr['stake_amount'], 'xsd:decimal')} ;")
-
-            # Remove trailing semicolon and add period
-            if turtle_lines and turtle_lines[-1].endswith(' ;'):
-                turtle_lines[-1] = turtle_lines[-1][:-2] + ' .'
-
-            turtle_lines.append("")
-
-        return '\n'.join(turtle_lines)
+            yield self._account_block(addr['view'], addr['hash_raw'], addr.get('stake_amount'))
+
+    def transform_columns(self, cols: dict[str, list[Any]]) -> str:
+        """Transform column-oriented stake addresses to RDF Turtle format."""
+        stake_amounts = cols.get('stake_amount') or [None] * len(cols['view'])
+        return '\n'.join(
+            self._account_block(view, hash_raw, stake_amount)
+            for view, hash_raw, stake_amount in zip(cols['view'], cols['hash_raw'], stake_amounts, strict=True)
+        )
+
+    def _account_block(self, view: str, hash_raw: str, stake_amount: Any) -> str:
+        """Build the Turtle block for one stake address."""
+        has_stake = bool(stake_amount) and stake_amount > 0
+
+        mask = 0
+        args = [self.create_stake_address_uri(view)]
+        if view:
+            mask |= _ACCOUNT_VIEW
+            args.append(view)
+        if hash_raw:
+            mask |= _ACCOUNT_HASH
+            args.append(hash_raw)
+        if has_stake:
+            mask |= _ACCOUNT_STAKE
+            args.append(self.format_literal(stake_amount, 'xsd:decimal'))
+
+        return _ACCOUNT_TEMPLATES[mask] % tuple(args) + "\n"
 
 class DelegationTransformer(BaseTransformer):
     """Transformer for delegation data aligned with Cardano ontology."""
 
-    def transform(self, delegations: list[dict[str, Any]]) -> str:
+    def iter_transform(self, delegations: list[dict[str, Any]]) -> Iterator[str]:
         """Transform delegations with stake amounts to RDF Turtle format."""
-        turtle_lines = []
+        stake_address_uri = memoized(self.create_stake_address_uri)
+        pool_uri_for = memoized(self.create_pool_uri)
 
         for delegation in delegations:
-            stake_addr_uri = self.create_stake_address_uri(delegation['stake_address'])
-            pool_uri = self.create_pool_uri(delegation['pool_hash'])
+            turtle_lines = []
+            stake_addr_uri = stake_address_uri(delegation['stake_address'])
+            pool_uri = pool_uri_for(delegation['pool_hash'])
 
             # Create delegation relationship
             turtle_lines.append(f"{stake_addr_uri} cardano:delegatesTo {pool_uri} .")
@@ -117,83 +143,64 @@ class DelegationTransformer(BaseTransformer):
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
+            yield '\n'.join(turtle_lines)
 
 class RewardTransformer(BaseTransformer):
     """Transformer for reward data aligned with Cardano ontology."""
 
-    def transform(self, rewards: list[dict[str, Any]]) -> str:
+    def iter_transform(self, rewards: list[dict[str, Any]]) -> Iterator[str]:
         """Transform rewards to RDF Turtle format with complete coverage."""
-        turtle_lines = []
+        stake_address_uri = memoized(self.create_stake_address_uri)
 
         for reward in rewards:
-            stake_addr_uri = self.create_stake_address_uri(reward['stake_address'])
+            # Stake address link, reward entity and its ADA token amount entity
             reward_uri = self.create_uri('reward', reward['id'])
-
-            # Link stake address to reward
-            turtle_lines.append(f"{stake_addr_uri} cardano:hasReward {reward_uri} .")
-
-            # Create reward entity with minimal properties from ontology
-            turtle_lines.append(f"{reward_uri} a cardano:Reward ;")
-
-            # Create token amount for the reward
             amount_uri = self.create_uri('token_amount', f"reward_{reward['id']}")
-            turtle_lines.append(f"    cardano:hasRewardAmount {amount_uri} ;")
+            stake_addr_uri = stake_address_uri(reward['stake_address'])
+            amount = self.format_literal(reward['amount'], 'xsd:decimal')
 
             if reward['type']:
-                turtle_lines.append(f"    cardano:hasRewardType \"{reward['type']}\" ;")
-
-            # Remove trailing semicolon and add period
-            if turtle_lines[-1].endswith(' ;'):
-                turtle_lines[-1] = turtle_lines[-1][:-2] + ' .'
-
-            # Create token amount entity
-            turtle_lines.append(f"")
-            turtle_lines.append(f"{amount_uri} a blockchain:TokenAmount ;")
-            turtle_lines.append(f"    blockchain:hasCurrency cardano:ADA ;")
-            turtle_lines.append(f"    blockchain:hasAmountValue {self.format_literal(reward['amount'], 'xsd:decimal')} .")
+                block = _REWARD_WITH_TYPE_TEMPLATE % (
+                    stake_addr_uri, reward_uri, reward_uri, amount_uri, reward['type'], amount_uri, amount
+                )
+            else:
+                block = _REWARD_WITHOUT_TYPE_TEMPLATE % (stake_addr_uri, reward_uri, reward_uri, amount_uri, amount_uri, amount)
 
-            turtle_lines.append("")
-
-        return '\n'.join(turtle_lines)
+            yield block + "\n"
 
 class WithdrawalTransformer(BaseTransformer):
     """Transformer for withdrawal data aligned with Cardano ontology."""
 
-    def transform(self, withdrawals: list[dict[str, Any]]) -> str:
+    def iter_transform(self, withdrawals: list[dict[str, Any]]) -> Iterator[str]:
         """Transform withdrawals to RDF Turtle format with complete coverage."""
-        turtle_lines = []
+        stake_address_uri = memoized(self.create_stake_address_uri)
+        transaction_uri = memoized(self.create_transaction_uri)
 
         for withdrawal in withdrawals:
+            turtle_lines = []
             withdrawal_uri = self.create_uri('withdrawal', withdrawal['id'])
 
             # Link withdrawal to account
             if withdrawal.get('stake_address'):
-                stake_addr_uri = self.create_stake_address_uri(withdrawal['stake_address'])
+                stake_addr_uri = stake_address_uri(withdrawal['stake_address'])
                 turtle_lines.append(f"{stake_addr_uri} cardano:hasWithdrawal {withdrawal_uri} .")
 
-            # Create withdrawal entity
-            turtle_lines.append(f"{withdrawal_uri} a cardano:Withdrawal ;")
-
             # Create token amount for withdrawal
             amount_uri = self.create_uri('token_amount', f"withdrawal_{withdrawal['id']}")
-            turtle_lines.append(f"    cardano:hasWithdrawalAmount {amount_uri} ;")
+            preds = [f"cardano:hasWithdrawalAmount {amount_uri}"]
 
             # Link to transaction
             if withdrawal.get('tx_hash'):
-                tx_uri = self.create_transaction_uri(withdrawal['tx_hash'])
-                turtle_lines.append(f"    cardano:withdrawnIn {tx_uri} ;")
+                tx_uri = transaction_uri(withdrawal['tx_hash'])
+                preds.append(f"cardano:withdrawnIn {tx_uri}")
 
-            # Remove trailing semicolon and add period
-            if turtle_lines[-1].endswith(' ;'):
-                turtle_lines[-1] = turtle_lines[-1][:-2] + ' .'
+            # Create withdrawal entity
+            turtle_lines.append(self._emit(withdrawal_uri, 'cardano:Withdrawal', preds))
 
             # Create token amount entity
-            turtle_lines.append(f"")
-            turtle_lines.append(f"{amount_uri} a blockchain:TokenAmount ;")
-            turtle_lines.append(f"    blockchain:hasCurrency cardano:ADA ;")
-            turtle_lines.append(f"    blockchain:hasAmountValue {self.format_literal(withdrawal['amount'], 'xsd:decimal')} .")
+            turtle_lines.append("")
+            turtle_lines.append(self.create_ada_amount(amount_uri, withdrawal['amount']))
 
             turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+            yield '\n'.join(turtle_lines)
\ No newline at end of file
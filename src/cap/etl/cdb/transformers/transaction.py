@@ -1,7 +1,7 @@
 import logging
-from typing import Any
+from typing import Any, Iterator
 
-from cap.etl.cdb.transformers.transformer import BaseTransformer
+from cap.etl.cdb.transformers.transformer import BaseTransformer, escape_turtle_string
 
 logger = logging.getLogger(__name__)
 
@@ -39,14 +39,14 @@ class TransactionTransformer(BaseTransformer):
 
         return False
 
-    def transform(self, transactions: list[dict[str, Any]]) -> str:
+    def iter_transform(self, transactions: list[dict[str, Any]]) -> Iterator[str]:
         """Transform transactions to RDF Turtle format with complete data coverage."""
-        turtle_lines = []
 
         # Track blocks that need transaction links
         block_tx_links = []
 
         for tx in transactions:
+            turtle_lines = []
             tx_uri = self.create_transaction_uri(tx['hash'])
 
             # Transaction as blockchain:Transaction
@@ -235,14 +235,14 @@ class TransactionTransformer(BaseTransformer):
                             # Extract proposal details if available
                             if isinstance(meta_obj, dict):
                                 if 'title' in meta_obj:
-                                    title = str(meta_obj['title']).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+                                    title = escape_turtle_string(str(meta_obj['title']))
                                     turtle_lines.append(f"    cardano:hasProposalTitle \"{title}\" ;")
                                 if 'abstract' in meta_obj or 'description' in meta_obj:
                                     desc = meta_obj.get('abstract', meta_obj.get('description', ''))
-                                    escaped_desc = str(desc).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+                                    escaped_desc = escape_turtle_string(str(desc))
                                     turtle_lines.append(f"    cardano:hasProposalDescription \"{escaped_desc}\" ;")
                                 if 'proposer' in meta_obj:
-                                    proposer = str(meta_obj['proposer']).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+                                    proposer = escape_turtle_string(str(meta_obj['proposer']))
                                     turtle_lines.append(f"    cardano:hasProposalProposer \"{proposer}\" ;")
                                 if 'budget' in meta_obj or 'amount' in meta_obj:
                                     budget = meta_obj.get('budget', meta_obj.get('amount', 0))
@@ -256,11 +256,15 @@ class TransactionTransformer(BaseTransformer):
                                 turtle_lines[-1] = turtle_lines[-1][:-2] + ' .'
                             turtle_lines.append("")
                     except Exception as e:
-                        logger.debug(f"Error parsing metadata JSON: {e}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Error parsing metadata JSON: {e}")
 
                 turtle_lines.append("")
 
+            yield '\n'.join(turtle_lines)
+
         # Add block-transaction relationships
+        turtle_lines = []
         for block_uri, tx_uri, timestamp in block_tx_links:
             turtle_lines.append(f"{block_uri} blockchain:hasTransaction {tx_uri} .")
             if timestamp:
@@ -268,4 +272,4 @@ class TransactionTransformer(BaseTransformer):
 
         turtle_lines.append("")
 
-        return '\n'.join(turtle_lines)
\ No newline at end of file
+        yield '\n'.join(turtle_lines)
\ No newline at end of file
@@ -3,35 +3,127 @@ Base transformer for cardano-db-sync ETL pipeline.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterator, Optional
 from urllib.parse import quote
 import logging
+import multiprocessing
+import os
 from functools import lru_cache
 
 from cap.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Escapes for Turtle string literals, applied in a single pass with str.translate
+_TTL_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
+def _needs_escape(value: str) -> bool:
+    """Check for characters that need escaping; each membership test is a C-level memchr scan."""
+    return '"' in value or '\\' in value or '\n' in value or '\r' in value or '\t' in value
+
+def escape_turtle_string(value: str) -> str:
+    """Escape backslashes, quotes and control characters for a Turtle string literal."""
+    # Most values (hashes, addresses, names) are clean and can be returned as is
+    return value.translate(_TTL_ESCAPES) if _needs_escape(value) else value
+
+def memoized(builder: Callable[[Any], str]) -> Callable[[Any], str]:
+    """
+    Wrap a URI builder with a plain dict cache, meant to live for one transform call.
+
+    Keys that repeat across a batch (stake addresses, pools, transactions) are built once,
+    without going through the shared create_uri cache that unique IDs keep evicting.
+    """
+    cache: dict[Any, str] = {}
+
+    def build(key: Any) -> str:
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = builder(key)
+            return value
+
+    return build
+
+def create_transform_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for transform_parallel.
+
+    Workers are started through a forkserver: the ETL submits work from threads while other
+    threads hold event loops, HTTP clients and database connections, and forking such a
+    process can deadlock the child on a lock held by another thread.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"))
+
+def emit_templates(type_iri: str, preds: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Precompute printf-style templates for a subject block with optional predicates.
+
+    The template at index mask holds the predicates whose bit is set in mask, laid out
+    exactly like BaseTransformer._emit, and takes the subject followed by the selected
+    predicates' arguments. Literal % signs in type_iri or preds must be written as %%.
+    """
+    templates = []
+    for mask in range(1 << len(preds)):
+        selected = [pred for bit, pred in enumerate(preds) if mask >> bit & 1]
+        if selected:
+            templates.append(f"%s a {type_iri} ;\n    " + " ;\n    ".join(selected) + " .")
+        else:
+            templates.append(f"%s a {type_iri} .")
+    return tuple(templates)
+
+def _uri_id(entity_type: str, identifier: Any) -> str:
+    """Encode an identifier for use as the last URI path segment."""
+    if identifier is None:
+        raise ValueError(f"Cannot create URI for {entity_type} with None identifier")
+
+    # Handle different identifier types
+    if isinstance(identifier, (int, float)):
+        return str(identifier)
+
+    identifier = str(identifier)
+    # Hex hashes and bech32 addresses are plain ASCII alphanumerics that quote leaves as is
+    if identifier.isascii() and identifier.isalnum():
+        return identifier
+
+    # URL encode the identifier to handle special characters
+    return quote(identifier, safe='')
+
+def ada_amount_block(amount_uri: str, amount_literal: str) -> str:
+    """
+    Lay out the statement block of an ADA TokenAmount entity.
+
+    Amounts get deterministic URIs rather than blank nodes, so reprocessing a batch after
+    a restart rewrites the same triples instead of adding duplicate amounts.
+    """
+    return (
+        f"{amount_uri} a blockchain:TokenAmount ;\n"
+        f"    blockchain:hasCurrency cardano:ADA ;\n"
+        f"    blockchain:hasAmountValue {amount_literal} ."
+    )
+
 class BaseTransformer(ABC):
-    """Base class for all data transformers with ontology alignment."""
+    """
+    Base class for all data transformers with ontology alignment.
+
+    iter_transform runs once per record, so implementations must not open tracer
+    spans inside their loops; spans belong to the per-batch callers.
+    """
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.base_uri = settings.CARDANO_GRAPH
 
+        # Fixed URI prefixes for the most frequently built entity URIs
+        self._epoch_prefix = f"<{self.base_uri}/epoch/"
+        self._stake_address_prefix = f"<{self.base_uri}/stake_address/"
+        self._pool_prefix = f"<{self.base_uri}/stake_pool/"
+        self._transaction_prefix = f"<{self.base_uri}/transaction/"
+        self._block_prefix = f"<{self.base_uri}/block/"
+
     @lru_cache(maxsize=10000)
     def create_uri(self, entity_type: str, identifier: Any) -> str:
         """Create a URI for an entity with proper encoding."""
-        if identifier is None:
-            raise ValueError(f"Cannot create URI for {entity_type} with None identifier")
-
-        # Handle different identifier types
-        if isinstance(identifier, (int, float)):
-            safe_id = str(identifier)
-        else:
-            # URL encode the identifier to handle special characters
-            safe_id = quote(str(identifier), safe='')
-
-        return f"<{self.base_uri}/{entity_type}/{safe_id}>"
+        return f"<{self.base_uri}/{entity_type}/{_uri_id(entity_type, identifier)}>"
 
     def create_hash_literal(self, hash_value: str) -> str:
         """Create a properly formatted hash literal."""
@@ -52,7 +144,11 @@ class BaseTransformer(ABC):
             logger.warning(f"Invalid amount value: {amount}, defaulting to 0")
             return '"0"^^xsd:decimal'
 
-    def format_literal(self, value: Any, datatype: str = None) -> str:
+    def create_ada_amount(self, amount_uri: str, amount: Any) -> str:
+        """Create the statement block of an ADA TokenAmount entity."""
+        return ada_amount_block(amount_uri, self.format_literal(amount, 'xsd:decimal'))
+
+    def format_literal(self, value: Any, datatype: Optional[str] = None) -> str:
         """Format a literal value with optional datatype."""
         if value is None:
             return '""'
@@ -60,7 +156,7 @@ class BaseTransformer(ABC):
         # Escape quotes and special characters in string values
         if isinstance(value, str):
             # More robust escaping needed
-            escaped_value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+            escaped_value = escape_turtle_string(value)
             if datatype:
                 return f'"{escaped_value}"^^{datatype}'
             else:
@@ -72,26 +168,32 @@ class BaseTransformer(ABC):
         else:
             return f'"{value}"'
 
+    def _emit(self, subject: str, type_iri: str, preds: list[str]) -> str:
+        """Build one Turtle statement block for a subject from its type and predicate-object pairs."""
+        if not preds:
+            return f"{subject} a {type_iri} ."
+        return f"{subject} a {type_iri} ;\n    " + " ;\n    ".join(preds) + " ."
+
     # Ontology-aligned URI creation methods
     def create_epoch_uri(self, epoch_no: int) -> str:
         """Create URI for epoch using ontology pattern."""
-        return self.create_uri('epoch', epoch_no)
+        return self._epoch_prefix + _uri_id('epoch', epoch_no) + '>'
 
     def create_stake_address_uri(self, stake_address: str) -> str:
         """Create URI for stake address using ontology pattern."""
-        return self.create_uri('stake_address', stake_address)
+        return self._stake_address_prefix + _uri_id('stake_address', stake_address) + '>'
 
     def create_pool_uri(self, pool_hash: str) -> str:
         """Create URI for stake pool using ontology pattern."""
-        return self.create_uri('stake_pool', pool_hash)
+        return self._pool_prefix + _uri_id('stake_pool', pool_hash) + '>'
 
     def create_transaction_uri(self, tx_hash: str) -> str:
         """Create URI for transaction using ontology pattern."""
-        return self.create_uri('transaction', tx_hash)
+        return self._transaction_prefix + _uri_id('transaction', tx_hash) + '>'
 
     def create_block_uri(self, block_hash: str) -> str:
         """Create URI for block using ontology pattern."""
-        return self.create_uri('block', block_hash)
+        return self._block_prefix + _uri_id('block', block_hash) + '>'
 
     def add_common_block_properties(self, block_uri: str, block: dict[str, Any]) -> list[str]:
         """Add common block properties aligned with ontology."""
@@ -110,6 +212,60 @@ class BaseTransformer(ABC):
         return lines
 
     @abstractmethod
+    def iter_transform(self, data: list[dict[str, Any]]) -> Iterator[str]:
+        """
+        Transform data to RDF Turtle, one block of complete statements per record.
+
+        Consumers can load blocks as they are produced instead of holding the whole batch
+        as a single string.
+        """
+        pass
+
     def transform(self, data: list[dict[str, Any]]) -> str:
         """Transform data to RDF Turtle format."""
-        pass
\ No newline at end of file
+        return '\n'.join(self.iter_transform(data))
+
+    def transform_into(self, data: list[dict[str, Any]], out: bytearray) -> None:
+        """
+        Append the UTF-8 encoded RDF Turtle for data to out.
+
+        Writes the same bytes as transform(data).encode(), block by block, so a caller can
+        reuse one buffer across batches instead of building the full string first.
+        """
+        separator = b''
+        for block in self.iter_transform(data):
+            out += separator
+            out += block.encode()
+            separator = b'\n'
+
+    def transform_columns(self, cols: dict[str, list[Any]]) -> str:
+        """
+        Transform column-oriented data (one equally long list per field) to RDF Turtle format.
+
+        The default rebuilds row dicts for transform; transformers on hot paths override it
+        to iterate the columns directly.
+        """
+        fields = list(cols)
+        return self.transform([dict(zip(fields, row, strict=True)) for row in zip(*cols.values(), strict=True)])
+
+    def transform_parallel(
+        self,
+        items: list[dict[str, Any]],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> str:
+        """
+        Transform data to RDF Turtle format across worker processes.
+
+        Items are split into about four chunks per worker and each chunk goes through
+        transform in a worker. Pass a long-lived executor to avoid spawning processes per call.
+        """
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(items) // (workers * 4))
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+
+        if executor is not None:
+            return '\n'.join(executor.map(self.transform, chunks))
+
+        with create_transform_executor(workers) as pool:
+            return '\n'.join(pool.map(self.transform, chunks))
\ No newline at end of file
@@ -1,8 +1,7 @@
 import logging
-import uvloop
-import asyncio
 import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,8 +12,8 @@ from sqlalchemy import text
 
 from cap.api.router import router as api_router
 from cap.api.nl_query import router as nl_router
-from cap.telemetry import setup_telemetry, instrument_app
-from cap.data.virtuoso import VirtuosoClient
+from cap.telemetry import setup_tracing, instrument_app, maybe_span
+from cap.data.virtuoso import VirtuosoClient, get_virtuoso_client, cleanup_virtuoso_client
 from cap.config import settings
 from cap.etl.cdb.service import etl_service
 from cap.services.ollama_client import cleanup_ollama_client
@@ -48,12 +47,15 @@ tracer = trace.get_tracer(__name__)
 etl_logger = logging.getLogger('cap.etl')
 etl_logger.setLevel(getattr(logging, settings.LOG_LEVEL))
 
-# Set uvloop as the event loop policy
-asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+@lru_cache
+def _read_ttl(path: str) -> bytes:
+    """Read an ontology file once per process, as raw bytes for posting to Virtuoso."""
+    with open(path, "rb") as f:
+        return f.read()
 
 async def initialize_graph(client: VirtuosoClient, graph_uri: str, ontology_path: str) -> bool:
     """Initialize a graph with ontology data if it doesn't exist."""
-    with tracer.start_as_current_span("initialize_graph") as span:
+    with maybe_span(tracer, "initialize_graph") as span:
         span.set_attribute("graph_uri", graph_uri)
         span.set_attribute("ontology_path", ontology_path)
 
@@ -63,11 +65,7 @@ async def initialize_graph(client: VirtuosoClient, graph_uri: str, ontology_path
             if not exists:
                 span.set_attribute("creating_new_graph", True)
 
-                if ontology_path != "":
-                    with open(ontology_path, "r") as f:
-                        turtle_data = f.read()
-                else:
-                    turtle_data = ""
+                turtle_data = _read_ttl(ontology_path) if ontology_path != "" else ""
 
                 await client.create_graph(graph_uri, turtle_data)
                 exists = await client.check_graph_exists(graph_uri)
@@ -89,7 +87,7 @@ async def initialize_graph(client: VirtuosoClient, graph_uri: str, ontology_path
 
 async def initialize_required_graphs(client: VirtuosoClient) -> None:
     """Initialize all required graphs for the application."""
-    with tracer.start_as_current_span("initialize_required_graphs") as span:
+    with maybe_span(tracer, "initialize_required_graphs") as span:
         required_graphs = [
             (settings.CARDANO_GRAPH, "src/ontologies/cardano.ttl"),
             (f"{settings.CARDANO_GRAPH}/metadata", "")
@@ -124,14 +122,13 @@ async def start_etl_service():
     if settings.ETL_AUTO_START:
         try:
             logger.info("Auto-starting ETL service...")
-            asyncio.create_task(
-                etl_service.start_etl(
-                    batch_size=settings.ETL_BATCH_SIZE,
-                    sync_interval=settings.ETL_SYNC_INTERVAL,
-                    continuous=settings.ETL_CONTINUOUS
-                )
+            # start_etl returns once the sync task is scheduled; etl_service holds and cancels that task
+            await etl_service.start_etl(
+                batch_size=settings.ETL_BATCH_SIZE,
+                sync_interval=settings.ETL_SYNC_INTERVAL,
+                continuous=settings.ETL_CONTINUOUS
             )
-            logger.info("ETL service auto-start task scheduled")
+            logger.info("ETL service auto-started")
         except Exception as e:
             logger.error(f"Failed to auto-start ETL service: {e}")
     else:
@@ -151,7 +148,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager with ETL integration."""
     if settings.ETL_AUTO_START:
         with tracer.start_as_current_span("application_startup") as span:
-            client = VirtuosoClient()
+            client = get_virtuoso_client()
 
             try:
                 # Initialize graphs
@@ -173,17 +170,9 @@ async def lifespan(app: FastAPI):
         await stop_etl_service()
         await cleanup_ollama_client()
         await cleanup_redis_client()
+        await cleanup_virtuoso_client()
         logger.info("Application shutdown completed")
 
-def setup_tracing():
-    # Only set up tracing if explicitly enabled
-    if settings.ENABLE_TRACING:
-        setup_telemetry()
-
-    else:
-        # Set a no-op tracer provider to disable tracing
-        trace.set_tracer_provider(trace.NoOpTracerProvider())
-
 def create_application() -> FastAPI:
     setup_tracing()
     app = FastAPI(
@@ -1,9 +1,14 @@
 """
 Redis client for caching SPARQL queries and natural language mappings.
 """
+import functools
+import hashlib
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional, Any
+import orjson
 import redis.asyncio as redis
 from opentelemetry import trace
 import os
@@ -14,6 +19,99 @@ logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 
+# Patterns and word lists used to normalize natural language queries
+_NUMBER_SEPARATOR_RE = re.compile(r'(?<=\d)[,.](?=\d)')
+_PUNCTUATION_RE = re.compile(r'[^\w\s=\-\+\*/]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Common filler words that don't affect meaning
+_FILLER_WORDS = frozenset({
+    'please', 'could', 'can', 'you', 'show', 'me', 'the', "plot", "have",
+    'what', 'is', 'are', 'was', 'were', 'how many', 'how much', 'tell', 'define', "your",
+    'give', 'find', 'get', 'a', 'an', 'of', 'in', 'on', "draw", "yours"
+})
+_QUESTION_WORDS = frozenset({'who', 'what', 'when', 'where', 'why', 'how many', 'how much', 'which', 'define'})
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_query(query: str) -> str:
+    """Normalize a natural language query; see RedisClient._normalize_query."""
+    # Convert to lowercase
+    normalized = query.lower()
+
+    # Normalize unicode (e.g., accented characters)
+    normalized = unicodedata.normalize('NFKD', normalized)
+    normalized = normalized.encode('ascii', 'ignore').decode('ascii')
+
+    # Protect commas and dots inside numbers (replace temporarily with placeholders)
+    normalized = _NUMBER_SEPARATOR_RE.sub(lambda m: '\uE000' if m.group() == ',' else '\uE001', normalized)
+
+    # Remove all unwanted punctuation
+    normalized = _PUNCTUATION_RE.sub('', normalized)
+
+    # Restore commas and dots inside numbers if we find placeholders
+    normalized = normalized.replace('\uE000', ',').replace('\uE001', '.')
+
+    # Normalize whitespace (multiple spaces to single)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
+
+    words = normalized.split()
+    filtered_words = [w for w in words if w not in _FILLER_WORDS]
+
+    # Handle question words specially (keep at start)
+    question_start = []
+    remaining_words = []
+
+    for word in filtered_words:
+        if word in _QUESTION_WORDS and not question_start:
+            question_start.append(word)
+        else:
+            remaining_words.append(word)
+
+    # Sort remaining words for queries where order doesn't matter
+    # This helps "balance of address X" == "address X balance"
+    remaining_words.sort()
+
+    # Reconstruct query
+    normalized = ' '.join(question_start + remaining_words)
+
+    return normalized.strip()
+
+
+class LocalTTLCache:
+    """Bounded in-process cache with per-entry expiry, used as an L1 in front of Redis."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
 class RedisClient:
     """Client for Redis caching operations."""
 
@@ -22,7 +120,10 @@ class RedisClient:
         host: Optional[str] = None,
         port: int = 6379,
         db: int = 0,
-        ttl: int = 86400 * 365  # 1 year is the default TTL
+        ttl: int = 86400 * 365,  # 1 year is the default TTL
+        results_ttl: int = 300,
+        local_ttl: int = 60,
+        local_maxsize: int = 1024
     ):
         """
         Initialize Redis client.
@@ -32,13 +133,21 @@ class RedisClient:
             port: Redis port
             db: Redis database number
             ttl: Default TTL for cache entries in seconds
+            results_ttl: TTL in seconds for cached SPARQL results, which go stale as the ETL syncs
+            local_ttl: TTL in seconds for the in-process L1 cache
+            local_maxsize: Maximum number of entries kept in the in-process L1 cache
         """
         self.host = host or os.getenv("REDIS_HOST", "localhost")
         self.port = int(os.getenv("REDIS_PORT", port))
         self.db = db
         self.ttl = ttl
+        self.results_ttl = results_ttl
         self._client: Optional[redis.Redis] = None
 
+        # In-process L1 caches, checked before going to Redis
+        self._local_queries = LocalTTLCache(maxsize=local_maxsize, ttl=local_ttl)
+        self._local_popular = LocalTTLCache(maxsize=16, ttl=local_ttl)
+
     async def _get_client(self) -> redis.Redis:
         """Get or create Redis client."""
         if self._client is None:
@@ -58,6 +167,11 @@ class RedisClient:
             await self._client.aclose()
             self._client = None
 
+    def clear_local_cache(self):
+        """Drop everything held in the in-process L1 caches."""
+        self._local_queries.clear()
+        self._local_popular.clear()
+
     def _normalize_query(self, query: str) -> str:
         """
         Normalize natural language query for better cache hits.
@@ -70,54 +184,7 @@ class RedisClient:
         5. Normalize unicode characters
         6. Sort words (for queries where order doesn't matter)
         """
-        # Convert to lowercase
-        normalized = query.lower()
-
-        # Normalize unicode (e.g., accented characters)
-        normalized = unicodedata.normalize('NFKD', normalized)
-        normalized = normalized.encode('ascii', 'ignore').decode('ascii')
-
-        # Protect commas and dots inside numbers (replace temporarily with placeholders)
-        normalized = re.sub(r'(?<=\d)[,.](?=\d)', lambda m: '\uE000' if m.group() == ',' else '\uE001', normalized)
-
-        # Remove all unwanted punctuation
-        normalized = re.sub(r'[^\w\s=\-\+\*/]', '', normalized)
-
-        # Restore commas and dots inside numbers if we find placeholders
-        normalized = normalized.replace('\uE000', ',').replace('\uE001', '.')
-
-        # Normalize whitespace (multiple spaces to single)
-        normalized = re.sub(r'\s+', ' ', normalized)
-
-        # Remove common filler words that don't affect meaning
-        filler_words = {
-            'please', 'could', 'can', 'you', 'show', 'me', 'the', "plot", "have",
-            'what', 'is', 'are', 'was', 'were', 'how many', 'how much', 'tell', 'define', "your",
-            'give', 'find', 'get', 'a', 'an', 'of', 'in', 'on', "draw", "yours"
-        }
-
-        words = normalized.split()
-        filtered_words = [w for w in words if w not in filler_words]
-
-        # Handle question words specially (keep at start)
-        question_words = {'who', 'what', 'when', 'where', 'why', 'how many', 'how much', 'which', 'define'}
-        question_start = []
-        remaining_words = []
-
-        for word in filtered_words:
-            if word in question_words and not question_start:
-                question_start.append(word)
-            else:
-                remaining_words.append(word)
-
-        # Sort remaining words for queries where order doesn't matter
-        # This helps "balance of address X" == "address X balance"
-        remaining_words.sort()
-
-        # Reconstruct query
-        normalized = ' '.join(question_start + remaining_words)
-
-        return normalized.strip()
+        return _normalize_query(query)
 
     def _make_cache_key(self, nl_query: str) -> str:
         """Create cache key from natural language query."""
@@ -187,6 +254,7 @@ class RedisClient:
                     ttl_value,
                     json.dumps(cache_data)
                 )
+                self._local_queries.set(cache_key, cache_data)
 
                 # Increment query count
                 await client.incr(count_key)
@@ -219,15 +287,23 @@ class RedisClient:
             span.set_attribute("nl_query", nl_query)
 
             try:
-                client = await self._get_client()
                 cache_key = self._make_cache_key(nl_query)
 
+                local = self._local_queries.get(cache_key)
+                if local is not None:
+                    span.set_attribute("cache_hit", True)
+                    span.set_attribute("local_cache_hit", True)
+                    return local
+
+                client = await self._get_client()
                 cached = await client.get(cache_key)
 
                 if cached:
                     span.set_attribute("cache_hit", True)
                     logger.debug(f"Cache hit for: {nl_query[:50]}...")
-                    return json.loads(cached)
+                    cache_data = json.loads(cached)
+                    self._local_queries.set(cache_key, cache_data)
+                    return cache_data
 
                 span.set_attribute("cache_hit", False)
                 return None
@@ -237,6 +313,132 @@ class RedisClient:
                 logger.error(f"Failed to retrieve cached query: {e}")
                 return None
 
+    def _sparql_digest(self, sparql_query: str) -> str:
+        """Hash the whitespace-canonicalized SPARQL query."""
+        canonical = _WHITESPACE_RE.sub(' ', sparql_query).strip()
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _make_results_key(self, sparql_query: str) -> str:
+        """Create results key from the SPARQL query."""
+        return f"nlq:results:{self._sparql_digest(sparql_query)}"
+
+    def _make_formatted_key(self, sparql_query: str) -> str:
+        """Create LLM-formatted results key from the SPARQL query."""
+        return f"nlq:fmt:{self._sparql_digest(sparql_query)}"
+
+    async def cache_sparql_results(
+        self,
+        sparql_query: str,
+        results: dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache SPARQL results keyed by the query itself, so every natural language
+        phrasing that maps to the same SPARQL shares one entry.
+
+        Args:
+            sparql_query: Executed SPARQL query (single query or serialized sequence)
+            results: SPARQL JSON results
+            ttl: Time-to-live in seconds (uses results_ttl if None)
+
+        Returns:
+            True if cached successfully
+        """
+        with tracer.start_as_current_span("cache_sparql_results") as span:
+            try:
+                client = await self._get_client()
+                await client.setex(
+                    self._make_results_key(sparql_query),
+                    ttl or self.results_ttl,
+                    orjson.dumps(results).decode()
+                )
+                span.set_attribute("cached", True)
+                return True
+
+            except Exception as e:
+                span.set_attribute("error", str(e))
+                logger.error(f"Failed to cache SPARQL results: {e}")
+                return False
+
+    async def get_cached_sparql_results(self, sparql_query: str) -> Optional[dict[str, Any]]:
+        """
+        Retrieve cached SPARQL results.
+
+        Args:
+            sparql_query: SPARQL query (single query or serialized sequence)
+
+        Returns:
+            SPARQL JSON results or None
+        """
+        with tracer.start_as_current_span("get_cached_sparql_results") as span:
+            try:
+                client = await self._get_client()
+                cached = await client.get(self._make_results_key(sparql_query))
+
+                span.set_attribute("cache_hit", bool(cached))
+                return orjson.loads(cached) if cached else None
+
+            except Exception as e:
+                span.set_attribute("error", str(e))
+                logger.error(f"Failed to retrieve cached SPARQL results: {e}")
+                return None
+
+    async def cache_formatted_results(
+        self,
+        sparql_query: str,
+        formatted_results: str,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache the LLM-ready formatting of SPARQL results, next to the results themselves.
+
+        Args:
+            sparql_query: Executed SPARQL query (single query or serialized sequence)
+            formatted_results: Output of format_for_llm for the query results
+            ttl: Time-to-live in seconds (uses results_ttl if None)
+
+        Returns:
+            True if cached successfully
+        """
+        with tracer.start_as_current_span("cache_formatted_results") as span:
+            try:
+                client = await self._get_client()
+                await client.setex(
+                    self._make_formatted_key(sparql_query),
+                    ttl or self.results_ttl,
+                    formatted_results
+                )
+                span.set_attribute("cached", True)
+                return True
+
+            except Exception as e:
+                span.set_attribute("error", str(e))
+                logger.error(f"Failed to cache formatted results: {e}")
+                return False
+
+    async def get_cached_formatted_results(self, sparql_query: str) -> Optional[str]:
+        """
+        Retrieve the cached LLM-ready formatting of SPARQL results.
+
+        Args:
+            sparql_query: SPARQL query (single query or serialized sequence)
+
+        Returns:
+            Formatted results or None
+        """
+        with tracer.start_as_current_span("get_cached_formatted_results") as span:
+            try:
+                client = await self._get_client()
+                cached = await client.get(self._make_formatted_key(sparql_query))
+
+                span.set_attribute("cache_hit", bool(cached))
+                return cached
+
+            except Exception as e:
+                span.set_attribute("error", str(e))
+                logger.error(f"Failed to retrieve cached formatted results: {e}")
+                return None
+
     async def get_query_count(self, nl_query: str) -> int:
         """
         Get the number of times a query has been asked.
@@ -272,6 +474,12 @@ class RedisClient:
             span.set_attribute("limit", limit)
 
             try:
+                local_key = str(limit)
+                local = self._local_popular.get(local_key)
+                if local is not None:
+                    span.set_attribute("local_cache_hit", True)
+                    return local
+
                 client = await self._get_client()
 
                 # Get all count keys
@@ -299,7 +507,9 @@ class RedisClient:
 
                 # Sort by count and return top N
                 queries_with_counts.sort(key=lambda x: x["count"], reverse=True)
-                return queries_with_counts[:limit]
+                popular = queries_with_counts[:limit]
+                self._local_popular.set(local_key, popular)
+                return popular
 
             except Exception as e:
                 span.set_attribute("error", str(e))
@@ -1,3 +1,5 @@
+from contextlib import nullcontext
+
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -5,6 +7,8 @@ from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
+from cap.config import settings
+
 def setup_telemetry():
     resource = Resource.create({"service.name": "cap"})
     trace.set_tracer_provider(TracerProvider(resource=resource))
@@ -14,4 +18,19 @@ def setup_telemetry():
     trace.get_tracer_provider().add_span_processor(span_processor)
 
 def instrument_app(app):
-    FastAPIInstrumentor.instrument_app(app)
\ No newline at end of file
+    FastAPIInstrumentor.instrument_app(app)
+
+def setup_tracing():
+    # Only set up tracing if explicitly enabled
+    if settings.ENABLE_TRACING:
+        setup_telemetry()
+
+    else:
+        # Set a no-op tracer provider to disable tracing
+        trace.set_tracer_provider(trace.NoOpTracerProvider())
+
+def maybe_span(tracer: trace.Tracer, name: str):
+    """Start a span when tracing is enabled, otherwise return a no-op context yielding a non-recording span."""
+    if settings.ENABLE_TRACING:
+        return tracer.start_as_current_span(name)
+    return nullcontext(trace.INVALID_SPAN)
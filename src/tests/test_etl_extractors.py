@@ -47,11 +47,11 @@ async def test_epoch_extractor_serialization(db_session):
     """Test epoch extractor data serialization."""
     extractor = ExtractorFactory.create_extractor('epoch', db_session, batch_size=10)
 
-    # Query for a single epoch to test serialization
-    epoch = db_session.query(Epoch).first()
+    # Serialize the first epoch through the extractor's own select
+    serialized = next(iter(next(extractor.extract_batch(), [])), None)
 
-    if epoch:
-        serialized = extractor._serialize_epoch(epoch)
+    if serialized:
+        epoch = db_session.get(Epoch, serialized['id'])
 
         assert 'id' in serialized
         assert 'no' in serialized
@@ -61,6 +61,11 @@ async def test_epoch_extractor_serialization(db_session):
         if epoch.no is not None:
             assert serialized['no'] == epoch.no
 
+        # Timestamps arrive already ISO-formatted by SQL, matching datetime.isoformat()
+        for field in ('start_time', 'end_time'):
+            expected = getattr(epoch, field)
+            assert serialized[field] == (expected.isoformat() if expected else None)
+
 @pytest.mark.asyncio
 async def test_extractor_factory_all_types():
     """Test that all extractor types can be created."""
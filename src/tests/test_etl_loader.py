@@ -39,6 +39,18 @@ async def test_loader_initialization():
     loader = CDBLoader()
     assert loader.virtuoso_client is not None
 
+@pytest.mark.asyncio
+async def test_loader_chunk_blocks():
+    """Test transformer blocks are merged into chunks without splitting statements."""
+    loader = CDBLoader()
+
+    blocks = [f"<http://test/s{i}> a blockchain:Block ;\n    blockchain:hasHash \"h{i}\" .\n" for i in range(5)]
+    chunks = list(loader._chunk_blocks(iter(blocks), chunk_size=6))
+
+    assert len(chunks) == 3
+    assert chunks[0] == '\n'.join(blocks[:2])
+    assert all(chunk.rstrip().endswith('.') for chunk in chunks)
+
 @pytest.mark.asyncio
 async def test_loader_load_batch_empty_data(virtuoso_client: VirtuosoClient):
     """Test loading empty batch data."""
@@ -194,4 +194,111 @@ async def test_multi_asset_transformer():
     assert 'cardano:CNT' in turtle_data
     assert 'blockchain:hasHash' in turtle_data
     assert 'cardano:hasPolicyId' in turtle_data
-    assert 'blockchain:hasTokenName' in turtle_data
\ No newline at end of file
+    assert 'blockchain:hasTokenName' in turtle_data
+
+@pytest.mark.asyncio
+async def test_datum_transformer():
+    """Test datum data transformation to RDF."""
+    transformer = TransformerFactory.create_transformer('datum')
+
+    test_datums = [{
+        'hash': 'datum123',
+        'value': {'fields': [{'bytes': 'a"b'}]},
+        'bytes': 'd8799f',
+        'tx_hash': 'tx123'
+    }]
+
+    turtle_data = transformer.transform(test_datums)
+
+    assert turtle_data
+    assert 'cardano:Datum' in turtle_data
+    assert 'cardano:hasDatumContent "{\\"fields\\":[{\\"bytes\\":\\"a\\\\\\"b\\"}]}"' in turtle_data
+    assert 'cardano:datumEmbeddedIn' in turtle_data
+    assert turtle_data.rstrip().endswith(' .')
+
+@pytest.mark.asyncio
+async def test_transform_parallel_matches_transform():
+    """Test transforming in worker processes yields the same RDF as a single pass."""
+    transformer = TransformerFactory.create_transformer('datum')
+
+    test_datums = [{
+        'hash': f'datum{i}',
+        'value': {'int': i},
+        'bytes': None,
+        'tx_hash': f'tx{i % 3}'
+    } for i in range(10)]
+
+    assert transformer.transform_parallel(test_datums, workers=2) == transformer.transform(test_datums)
+
+@pytest.mark.asyncio
+async def test_reward_transformer():
+    """Test reward amounts are emitted as ADA token amounts with deterministic URIs."""
+    transformer = TransformerFactory.create_transformer('reward')
+
+    test_rewards = [{
+        'id': 1,
+        'stake_address': 'stake1ux...',
+        'type': 'member',
+        'amount': 5000000
+    }]
+
+    turtle_data = transformer.transform(test_rewards)
+    amount_uri = f"<{settings.CARDANO_GRAPH}/token_amount/reward_1>"
+
+    assert 'cardano:Reward' in turtle_data
+    assert f'cardano:hasRewardAmount {amount_uri}' in turtle_data
+    assert (
+        f'{amount_uri} a blockchain:TokenAmount ;\n'
+        '    blockchain:hasCurrency cardano:ADA ;\n'
+        '    blockchain:hasAmountValue "5000000"^^xsd:decimal .'
+    ) in turtle_data
+
+@pytest.mark.asyncio
+async def test_transform_columns_matches_transform():
+    """Test column-oriented input yields the same RDF as the equivalent rows."""
+    test_addresses = [
+        {'view': 'stake1ux1', 'hash_raw': 'abcd', 'stake_amount': 5},
+        {'view': 'stake1ux2', 'hash_raw': None, 'stake_amount': 0},
+    ]
+    test_rewards = [
+        {'id': 1, 'stake_address': 'stake1ux1', 'type': 'member', 'amount': 10},
+        {'id': 2, 'stake_address': 'stake1ux2', 'type': None, 'amount': 20},
+    ]
+
+    for entity_type, rows in (('stake_address', test_addresses), ('reward', test_rewards)):
+        transformer = TransformerFactory.create_transformer(entity_type)
+        cols = {field: [row[field] for row in rows] for field in rows[0]}
+
+        assert transformer.transform_columns(cols) == transformer.transform(rows)
+
+@pytest.mark.asyncio
+async def test_transform_into_matches_transform():
+    """Test writing into a reused byte buffer yields the encoded transform output."""
+    transformer = TransformerFactory.create_transformer('stake_address')
+
+    test_addresses = [
+        {'view': 'stake1ux1', 'hash_raw': 'abcd', 'stake_amount': 5},
+        {'view': 'stake1ux2', 'hash_raw': None, 'stake_amount': 0},
+    ]
+
+    out = bytearray(b'previous batch')
+    out.clear()
+    transformer.transform_into(test_addresses, out)
+
+    assert bytes(out) == transformer.transform(test_addresses).encode()
+
+@pytest.mark.asyncio
+async def test_datum_transformer_big_integer():
+    """Test datum values with integers beyond 64 bits are still serialized."""
+    transformer = TransformerFactory.create_transformer('datum')
+
+    test_datums = [{
+        'hash': 'datum123',
+        'value': {'int': 2**70},
+        'bytes': None,
+        'tx_hash': None
+    }]
+
+    turtle_data = transformer.transform(test_datums)
+
+    assert f'cardano:hasDatumContent "{{\\"int\\":{2**70}}}"' in turtle_data
@@ -0,0 +1,266 @@
+import asyncio
+import time
+
+import pytest
+
+from cap.api.nl_query import (
+    StatusMessage,
+    _coerce_binding_value,
+    _evaluate_injection,
+    _execute_sequential_queries,
+    _execute_with_results_cache,
+    _parse_cached_sequential_sparql,
+    _plan_query_levels,
+    _stream_with_timeout_messages,
+)
+from cap.data import virtuoso as virtuoso_module
+from cap.data.sparql_util import convert_sparql_to_kv, format_simple_answer
+from cap.data.virtuoso import VirtuosoClient, VirtuosoConfig
+from cap.services.redis_client import RedisClient
+
+def test_evaluate_injection_arithmetic():
+    """Test injection expressions resolve variables from previous results."""
+    previous_results = {'total': 55, 'total_blocks': 3}
+
+    assert _evaluate_injection('INJECT(total/10)', previous_results) == 6
+    assert _evaluate_injection('INJECT(max(total, total_blocks) // 2)', previous_results) == 27
+    assert _evaluate_injection('INJECT(ceil(total_blocks * 1.5) - -1)', previous_results) == 6
+    assert _evaluate_injection('INJECT(total_blocks ** 2)', previous_results) == 9
+
+def test_evaluate_injection_missing_variable():
+    """Test injection falls back to 1 when a variable is not available."""
+    assert _evaluate_injection('INJECT(count + 1)', {'total': 5}) == 1
+
+def test_evaluate_injection_overlapping_variable_names():
+    """Test variables that are prefixes of one another resolve independently."""
+    previous_results = {'total': 10, 'total_blocks': 3, 'total_blocks_count': 7}
+
+    assert _evaluate_injection('INJECT(total_blocks_count - total_blocks + total)', previous_results) == 14
+
+def test_coerce_binding_value():
+    """Test SPARQL binding values are stored as numbers when they look numeric."""
+    assert _coerce_binding_value('42') == 42
+    assert isinstance(_coerce_binding_value('42.0'), int)
+    assert _coerce_binding_value('2.5') == 2.5
+    assert _coerce_binding_value('addr1xyz') == 'addr1xyz'
+    assert _coerce_binding_value(None) is None
+
+@pytest.mark.parametrize('expression', [
+    'INJECT(__import__("os"))',
+    'INJECT(total.real)',
+    'INJECT([total][0])',
+    'INJECT(lambda: total)',
+    'INJECT(9**9**9)',
+    'INJECT((((9**64)**64)**64)**64)',
+    'INJECT("a" * 1000000000)',
+])
+def test_evaluate_injection_rejects_unsafe_expressions(expression):
+    """Test injection refuses anything beyond arithmetic and whitelisted calls."""
+    assert _evaluate_injection(expression, {'total': 5}) == 1
+
+def test_parse_cached_sequential_sparql():
+    """Test parsing of the old separator-based sequential SPARQL format."""
+    sparql_text = (
+        "---query 1---\nSELECT (COUNT(?b) AS ?total) WHERE { ?b a blockchain:Block }\n"
+        "---query 2 (uses total)---\nSELECT ?b WHERE { ?b a blockchain:Block } LIMIT INJECT(total/10)"
+    )
+
+    queries = _parse_cached_sequential_sparql(sparql_text)
+
+    assert len(queries) == 2
+    assert queries[0]['inject_params'] == []
+    assert queries[1]['inject_params'] == ['INJECT(total/10)']
+
+class _ResultsCacheStub:
+    """In-memory stand-in for the SPARQL results part of RedisClient."""
+
+    _sparql_digest = RedisClient._sparql_digest
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get_cached_sparql_results(self, sparql_query):
+        return self.entries.get(sparql_query)
+
+    async def cache_sparql_results(self, sparql_query, results):
+        self.entries[sparql_query] = results
+        return True
+
+@pytest.mark.asyncio
+async def test_execute_with_results_cache_reuses_results():
+    """Test SPARQL results are executed once and then served from the results cache."""
+    cache = _ResultsCacheStub()
+    calls = []
+    results = {'results': {'bindings': [{'count': {'type': 'literal', 'value': '42'}}]}}
+
+    async def execute():
+        calls.append(1)
+        return results
+
+    first = await _execute_with_results_cache(cache, 'SELECT (COUNT(?b) AS ?count) {}', execute)
+    second = await _execute_with_results_cache(cache, 'SELECT (COUNT(?b) AS ?count) {}', execute)
+
+    assert first == (results, False)
+    assert second == (results, True)
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_execute_with_results_cache_skips_empty_results():
+    """Test empty SPARQL results are not cached."""
+    cache = _ResultsCacheStub()
+
+    async def execute():
+        return {'results': {'bindings': []}}
+
+    await _execute_with_results_cache(cache, 'SELECT ?b {}', execute)
+
+    assert cache.entries == {}
+
+class _VirtuosoStub:
+    """Records executed queries and answers with a fixed count binding."""
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute_query(self, query):
+        self.executed.append(query)
+        return {'results': {'bindings': [{'total': {'type': 'literal', 'value': '55'}}]}}
+
+@pytest.mark.asyncio
+async def test_execute_sequential_queries_injects_every_site():
+    """Test all INJECT sites of a query are replaced using previous results."""
+    virtuoso = _VirtuosoStub()
+    queries = [
+        {'query': 'SELECT (COUNT(?b) AS ?total) WHERE { ?b a blockchain:Block }', 'inject_params': []},
+        {
+            'query': 'SELECT ?b WHERE { ?b a blockchain:Block } LIMIT INJECT(total/10) OFFSET INJECT(ceil(total/100))',
+            'inject_params': ['INJECT(total/10)', 'INJECT(ceil(total/100))'],
+        },
+    ]
+
+    await _execute_sequential_queries(virtuoso, queries)
+
+    assert virtuoso.executed[1] == 'SELECT ?b WHERE { ?b a blockchain:Block } LIMIT 6 OFFSET 1'
+
+class _ScriptedSPARQLWrapper:
+    """SPARQLWrapper double answering from a query-to-results script, after a delay."""
+
+    script: dict[str, dict] = {}
+
+    def __init__(self, endpoint):
+        self._query = None
+
+    def setCredentials(self, user, passwd):
+        pass
+
+    def setReturnFormat(self, format):
+        pass
+
+    def setTimeout(self, timeout):
+        pass
+
+    def setMethod(self, method):
+        pass
+
+    def setQuery(self, query):
+        self._query = query
+
+    def query(self):
+        time.sleep(0.05)
+        result = self.script.get(self._query, {})
+        return type('Result', (), {'convert': lambda _self: result})()
+
+@pytest.mark.asyncio
+async def test_execute_sequential_queries_concurrent_level_keeps_results_apart(monkeypatch):
+    """Test independent queries run in one level on a shared client each get their own results."""
+    def bindings(var, value):
+        return {'results': {'bindings': [{var: {'type': 'literal', 'value': value}}]}}
+
+    monkeypatch.setattr(virtuoso_module, "SPARQLWrapper", _ScriptedSPARQLWrapper)
+    monkeypatch.setattr(_ScriptedSPARQLWrapper, "script", {
+        'SELECT ?a WHERE { ?s cardano:a ?a }': bindings('a', '1'),
+        'SELECT ?b WHERE { ?s cardano:b ?b }': bindings('b', '2'),
+        'SELECT ?s WHERE { ?s ?p ?o } LIMIT 12': bindings('s', 'done'),
+    })
+    virtuoso = VirtuosoClient(VirtuosoConfig(sparql_str_endpoint="/sparql"))
+    queries = [
+        {'query': 'SELECT ?a WHERE { ?s cardano:a ?a }', 'inject_params': []},
+        {'query': 'SELECT ?b WHERE { ?s cardano:b ?b }', 'inject_params': []},
+        {'query': 'SELECT ?s WHERE { ?s ?p ?o } LIMIT INJECT(a*10+b)', 'inject_params': ['INJECT(a*10+b)']},
+    ]
+
+    assert _plan_query_levels(queries) == [[0, 1], [2]]
+    assert await _execute_sequential_queries(virtuoso, queries) == bindings('s', 'done')
+
+@pytest.mark.asyncio
+async def test_execute_with_results_cache_coalesces_concurrent_calls():
+    """Test concurrent SPARQL queries differing only in whitespace share one backend execution."""
+    cache = _ResultsCacheStub()
+    calls = []
+    results = {'results': {'bindings': [{'count': {'type': 'literal', 'value': '42'}}]}}
+
+    async def execute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return results
+
+    queries = ['SELECT (COUNT(?b) AS ?count) {}', 'SELECT  (COUNT(?b) AS ?count)\n{}', ' SELECT (COUNT(?b) AS ?count) {} ']
+    responses = await asyncio.gather(*(_execute_with_results_cache(cache, query, execute) for query in queries * 2))
+
+    assert responses == [(results, False)] * 6
+    assert len(calls) == 1
+
+def test_plan_query_levels():
+    """Test independent sequential queries share a level and dependent ones wait for every possible source."""
+    queries = [
+        {'query': 'SELECT (COUNT(?b) AS ?total_blocks) WHERE { ?b a blockchain:Block }'},
+        {'query': 'SELECT (COUNT(?t) AS ?total_txs) WHERE { ?t a blockchain:Transaction }'},
+        {'query': 'SELECT ?b WHERE { ?b a blockchain:Block } LIMIT INJECT(total_blocks/10)'},
+        {'query': 'SELECT ?t WHERE { ?t a blockchain:Transaction } LIMIT INJECT(unknown + 1)'},
+    ]
+
+    assert _plan_query_levels(queries) == [[0, 1], [2], [3]]
+
+    # A later query that only mentions ?x must not hide the query that binds it
+    queries = [
+        {'query': 'SELECT (COUNT(?b) AS ?total) WHERE { ?b a blockchain:Block }'},
+        {'query': 'SELECT ?x WHERE { ?x a blockchain:Block } LIMIT INJECT(total/10)'},
+        {'query': 'SELECT ?t WHERE { ?t a blockchain:Transaction . FILTER(?t != ?x) }'},
+        {'query': 'SELECT ?t WHERE { ?t a blockchain:Transaction } LIMIT INJECT(x + 1)'},
+    ]
+
+    assert _plan_query_levels(queries) == [[0, 2], [1], [3]]
+
+def test_format_simple_answer():
+    """Test only single-value and ASK results get a direct answer."""
+    count = {'results': {'bindings': [{'block_count': {
+        'type': 'literal', 'datatype': 'http://www.w3.org/2001/XMLSchema#integer', 'value': '21600'
+    }}]}}
+    row = {'results': {'bindings': [{'a': {'type': 'literal', 'value': '1'}, 'b': {'type': 'literal', 'value': '2'}}]}}
+
+    assert format_simple_answer(convert_sparql_to_kv(count)) == "The block count is 21600."
+    assert format_simple_answer(convert_sparql_to_kv({'boolean': True})) == "Yes."
+    assert format_simple_answer(convert_sparql_to_kv(row)) is None
+
+@pytest.mark.asyncio
+async def test_stream_with_timeout_messages_emits_thinking_message():
+    """Test a status message is emitted while the stream is silent, without losing chunks."""
+    async def slow_stream():
+        await asyncio.sleep(0.05)
+        yield "answer"
+
+    chunks = [chunk async for chunk in _stream_with_timeout_messages(slow_stream(), timeout_seconds=0.01)]
+
+    assert chunks[0] == StatusMessage.THINKING_MESSAGES[0]
+    assert chunks[-1] == "answer"
+
+@pytest.mark.asyncio
+async def test_stream_with_timeout_messages_reports_errors():
+    """Test an error raised by the stream is forwarded to the client as an error line."""
+    async def failing_stream():
+        yield "partial"
+        raise RuntimeError("boom")
+
+    chunks = [chunk async for chunk in _stream_with_timeout_messages(failing_stream())]
+
+    assert chunks == ["partial", "error: Stream error: boom\n"]
@@ -0,0 +1,65 @@
+import pytest
+
+from cap.services import redis_client as redis_client_module
+from cap.services.redis_client import LocalTTLCache, RedisClient
+
+class _Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_local_cache_expires_entries(monkeypatch):
+    """Test entries are dropped once their TTL has passed."""
+    clock = _Clock()
+    monkeypatch.setattr(redis_client_module.time, "monotonic", clock)
+    cache = LocalTTLCache(maxsize=4, ttl=60)
+
+    cache.set("query", {"sparql_query": "SELECT 1"})
+    clock.now += 59
+    assert cache.get("query") == {"sparql_query": "SELECT 1"}
+
+    clock.now += 2
+    assert cache.get("query") is None
+
+def test_local_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted when the cache is full."""
+    cache = LocalTTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+class _RedisStub:
+    """Records reads so tests can tell whether Redis was reached."""
+
+    def __init__(self):
+        self.reads = []
+
+    async def get(self, key):
+        self.reads.append(key)
+        return None
+
+@pytest.mark.asyncio
+async def test_get_cached_query_local_hit_skips_redis():
+    """Test a query held in the L1 cache is answered without reading Redis."""
+    client = RedisClient()
+    redis_stub = _RedisStub()
+    client._client = redis_stub
+    cached = {"sparql_query": "SELECT 1", "results": {}}
+    client._local_queries.set(client._make_cache_key("How many blocks?"), cached)
+
+    assert await client.get_cached_query("How many blocks?") == cached
+    assert redis_stub.reads == []
+
+    assert await client.get_cached_query("How many transactions?") is None
+    assert len(redis_stub.reads) == 1
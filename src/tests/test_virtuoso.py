@@ -1,4 +1,8 @@
+import asyncio
+import time
+
 import pytest
+from cap.data import virtuoso
 from cap.data.virtuoso import VirtuosoClient
 
 TEST_GRAPH = "http://test.graph"
@@ -85,4 +89,40 @@ async def test_update_graph(virtuoso_client: VirtuosoClient):
     assert result.get('boolean') is True
 
     # Cleanup
-    await virtuoso_client.delete_graph(TEST_GRAPH)
\ No newline at end of file
+    await virtuoso_client.delete_graph(TEST_GRAPH)
+
+class _EchoSPARQLWrapper:
+    """SPARQLWrapper double that answers with the query it was given, after a delay."""
+
+    def __init__(self, endpoint):
+        self._query = None
+
+    def setCredentials(self, user, passwd):
+        pass
+
+    def setReturnFormat(self, format):
+        pass
+
+    def setTimeout(self, timeout):
+        pass
+
+    def setMethod(self, method):
+        pass
+
+    def setQuery(self, query):
+        self._query = query
+
+    def query(self):
+        time.sleep(0.05)
+        result = {'query': self._query}
+        return type('Result', (), {'convert': lambda _self: result})()
+
+@pytest.mark.asyncio
+async def test_execute_query_concurrent_calls_get_their_own_results(monkeypatch):
+    monkeypatch.setattr(virtuoso, "SPARQLWrapper", _EchoSPARQLWrapper)
+    client = VirtuosoClient(virtuoso.VirtuosoConfig(sparql_str_endpoint="/sparql"))
+
+    queries = [f"SELECT ?s WHERE {{ ?s ?p {i} }}" for i in range(4)]
+    results = await asyncio.gather(*(client.execute_query(query) for query in queries))
+
+    assert [result['query'] for result in results] == queries